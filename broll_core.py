@@ -1,13 +1,27 @@
 import os
 import re
-import json
+import io
+import mmap
 import shutil
-from typing import Callable, Tuple, List
-
-import whisper
-import spacy
-import requests
-from playwright.async_api import async_playwright
+import asyncio
+import tempfile
+import threading
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Callable, Iterator, Tuple, List, NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import orjson
+import xxhash
+import yake
+from PIL import Image
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+# faster-whisper / CTranslate2 are imported where they're used: importing this
+# module (the GUI, settings dialogs, scraper tests) shouldn't pay for them.
 
 
 APP_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -17,7 +31,13 @@ DEFAULTS_PATH = os.path.join(APP_DIR, "settings.json")
 # -------- Settings --------
 DEFAULT_SETTINGS = {
     "whisper_model": "base",
+    # "auto" = int8 on CPU, int8_float16 on CUDA; or int8 / int8_float16 / float16 / float32
+    "whisper_compute_type": "auto",
+    # >1 = split audio and transcribe in that many CPU processes (RAM scales with it)
+    "whisper_workers": 1,
     "images_per_keyword": 3,
+    # How many keyword searches run at once (one browser tab each)
+    "max_parallel_keywords": 4,
     "max_keywords": 20,
     "max_total_images": 60,
     "max_scrolls_per_keyword": 6,
@@ -29,30 +49,75 @@ DEFAULT_SETTINGS = {
 }
 
 
+# path -> (st_mtime_ns, parsed dict)
+_json_cache: dict[str, Tuple[int, dict]] = {}
+
+
+def read_settings_json(path: str = DEFAULTS_PATH) -> dict:
+    """Return the parsed contents of a JSON settings file.
+
+    The parse is cached in memory and reused until the file's mtime changes,
+    so repeated calls cost one stat(). Raises like open()/orjson.loads().
+    """
+    mtime = os.stat(path).st_mtime_ns
+    hit = _json_cache.get(path)
+    if hit is not None and hit[0] == mtime:
+        return dict(hit[1])
+
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
+    _json_cache[path] = (mtime, data)
+    return dict(data)
+
+
+def write_settings_json(path: str, settings: dict) -> None:
+    """Write a JSON settings file and refresh the read cache without re-reading it."""
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+    _json_cache[path] = (os.stat(path).st_mtime_ns, dict(settings))
+
+
+@lru_cache(maxsize=1)
+def _merged_settings(mtime_ns: int) -> dict:
+    # mtime_ns is only the cache key: a new mtime means a new merge
+    data = read_settings_json(DEFAULTS_PATH)
+    merged = dict(DEFAULT_SETTINGS)
+    merged.update({k: v for k, v in data.items() if k in DEFAULT_SETTINGS})
+    return merged
+
+
 def load_settings() -> dict:
-    if os.path.exists(DEFAULTS_PATH):
-        try:
-            with open(DEFAULTS_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            merged = dict(DEFAULT_SETTINGS)
-            merged.update({k: v for k, v in data.items() if k in DEFAULT_SETTINGS})
-            return merged
-        except Exception:
-            return dict(DEFAULT_SETTINGS)
-    return dict(DEFAULT_SETTINGS)
+    try:
+        return dict(_merged_settings(os.stat(DEFAULTS_PATH).st_mtime_ns))
+    except Exception:
+        return dict(DEFAULT_SETTINGS)
 
 
 def save_settings(settings: dict) -> None:
-    with open(DEFAULTS_PATH, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2)
+    write_settings_json(DEFAULTS_PATH, settings)
 
 
 # -------- Helpers --------
+_FOLDER_ALLOWED = set("abcdefghijklmnopqrstuvwxyz0123456789_- ")
+# ASCII bytes safe_folder_name deletes (bytes.translate: a flat table lookup per byte)
+_FOLDER_DROP_BYTES = bytes(c for c in range(128) if chr(c) not in _FOLDER_ALLOWED)
+_FOLDER_UNSAFE_RE = re.compile(r"[^a-z0-9_\- ]+")
+_WS_RE = re.compile(r"\s+")
+# Keyword -> image filename part: spaces and path separators become "_"
+KEYWORD_FILENAME_TABLE = str.maketrans({" ": "_", "/": "_"})
+# Image files by extension (case-insensitive), for directory listings
+is_image_file = re.compile(r"\.(?:jpe?g|png)$", re.I).search
+
+
 def safe_folder_name(s: str) -> str:
     s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9_\- ]+", "", s)
-    s = re.sub(r"\s+", "_", s)
-    return s[:80] if s else "keyword"
+    if s.isascii():
+        s = s.encode("ascii").translate(None, _FOLDER_DROP_BYTES).decode("ascii")
+    else:
+        # Not representable as bytes; strip it the slow way.
+        s = _FOLDER_UNSAFE_RE.sub("", s)
+    s = _WS_RE.sub("_", s)
+    return s[:80] or "keyword"
 
 
 def ensure_dir(p: str) -> None:
@@ -73,70 +138,331 @@ def which_browser_executable():
 def format_srt_time(seconds: float) -> str:
     # HH:MM:SS,mmm
     ms = int(round(seconds * 1000))
-    h = ms // (3600 * 1000)
-    ms -= h * 3600 * 1000
-    m = ms // (60 * 1000)
-    ms -= m * 60 * 1000
-    s = ms // 1000
-    ms -= s * 1000
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
     return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
 
-def generate_srt(video_path: str, whisper_model_name: str) -> Tuple[str, str]:
-    """Run Whisper on a local video file and write a single SRT file.
+_whisper_lock = threading.Lock()
+
+
+def _load_whisper(whisper_model_name: str, compute_type: str, cpu_threads: int = 0) -> "WhisperModel":
+    """Load (and keep) a Whisper model so repeated runs skip the load.
+
+    Every job in the process shares the same instance. The lock stops concurrent
+    first calls (e.g. the startup warm-up and the first job) from each loading a copy.
+    """
+    with _whisper_lock:
+        return _load_whisper_cached(whisper_model_name, compute_type, cpu_threads)
+
+
+@lru_cache(maxsize=2)
+def _load_whisper_cached(whisper_model_name: str, compute_type: str, cpu_threads: int) -> "WhisperModel":
+    from faster_whisper import WhisperModel
+
+    n_gpus = whisper_parallelism()
+    if n_gpus > 1:
+        # One replica per GPU; concurrent transcribe() calls (one per thread)
+        # are spread across them by CTranslate2
+        return WhisperModel(
+            whisper_model_name, device="cuda", device_index=list(range(n_gpus)),
+            num_workers=n_gpus, compute_type=compute_type,
+        )
+    return WhisperModel(whisper_model_name, device="auto", compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+def whisper_parallelism() -> int:
+    """How many generate_srt calls can usefully run at once: one per CUDA device.
+
+    On CPU this is 1; a single transcription already keeps the cores busy
+    (use generate_srt's workers to shard one file instead).
+    """
+    try:
+        import ctranslate2
+    except ImportError:
+        # Not installed: transcription fails per job with the real error, later
+        return 1
+    return max(1, ctranslate2.get_cuda_device_count())
+
+
+# -------- Sharded CPU transcription (ffmpeg segments + process pool) --------
+_SHARD_SECONDS = 45
+
+
+class _Segment(NamedTuple):
+    start: float
+    end: float
+    text: str
+
+
+def _split_audio(video_path: str, out_dir: str) -> List[str]:
+    """Cut the audio track into _SHARD_SECONDS-long 16 kHz mono WAV files with ffmpeg."""
+    subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-loglevel", "error", "-y",
+            "-i", video_path, "-vn", "-ac", "1", "-ar", "16000",
+            "-f", "segment", "-segment_time", str(_SHARD_SECONDS), "-reset_timestamps", "1",
+            os.path.join(out_dir, "chunk_%03d.wav"),
+        ],
+        check=True,
+    )
+    return sorted(
+        os.path.join(out_dir, name) for name in os.listdir(out_dir)
+        if name.startswith("chunk_") and name.endswith(".wav")
+    )
+
+
+def _transcribe_chunk(args: Tuple[str, str, str, int, str | None]) -> List[_Segment]:
+    """Worker: transcribe one shard (each worker process loads its own model)."""
+    chunk_path, whisper_model_name, compute_type, cpu_threads, language = args
+    model = _load_whisper(whisper_model_name, compute_type, cpu_threads)
+    segments, _info = model.transcribe(chunk_path, language=language, beam_size=1, vad_filter=True)
+    return [_Segment(seg.start, seg.end, seg.text) for seg in segments]
+
+
+def _transcribe_sharded(
+    video_path: str, whisper_model_name: str, compute_type: str, workers: int, language: str | None
+) -> List[_Segment]:
+    """Transcribe shards in parallel and shift their timestamps back onto the full timeline.
+
+    Shards don't overlap, so a word that straddles a cut may be split or dropped.
+    Memory scales with workers: every process holds its own model.
+    """
+    cpu_threads = max(1, (os.cpu_count() or 1) // workers)
+    with tempfile.TemporaryDirectory(prefix="srt_shards_") as tmp:
+        chunks = _split_audio(video_path, tmp)
+        jobs = [(c, whisper_model_name, compute_type, cpu_threads, language) for c in chunks]
+        # spawn: never fork a parent that may already hold CTranslate2 threads
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as ex:
+            results = list(ex.map(_transcribe_chunk, jobs))
+
+    merged: List[_Segment] = []
+    for idx, segs in enumerate(results):
+        offset = idx * float(_SHARD_SECONDS)
+        merged.extend(_Segment(s.start + offset, s.end + offset, s.text) for s in segs)
+    return merged
+
+
+WHISPER_COMPUTE_TYPES = ["auto", "int8", "int8_float16", "float16", "float32"]
+
+
+def _resolve_compute_type(compute_type: str) -> Tuple[str, bool]:
+    """Returns (concrete compute type, cuda available)."""
+    import ctranslate2
+
+    use_cuda = ctranslate2.get_cuda_device_count() > 0
+    if compute_type == "auto":
+        compute_type = "int8_float16" if use_cuda else "int8"
+    return compute_type, use_cuda
+
+
+def _cpu_threads(use_cuda: bool) -> int:
+    """Intra-op threads for an in-process model: about one per physical core on CPU.
+
+    CTranslate2's own default is 4 regardless of the machine. 0 keeps that on GPU.
+    """
+    return 0 if use_cuda else max(1, (os.cpu_count() or 2) // 2)
+
+
+def preload_whisper(whisper_model_name: str, compute_type: str = "auto") -> None:
+    """Load a Whisper model into the in-process cache before the first generate_srt."""
+    compute_type, use_cuda = _resolve_compute_type(compute_type)
+    _load_whisper(whisper_model_name, compute_type, _cpu_threads(use_cuda))
+    # May have just finished a download inside an existing repo dir (no mtime bump)
+    _model_available_cache.clear()
+
+
+# (model name, hub cache dir mtime_ns) -> available; a new download adds a
+# directory there, which bumps the mtime and retires stale entries
+_model_available_cache: dict = {}
+
+
+def _hf_hub_cache() -> str:
+    # huggingface_hub only arrives with faster-whisper; without it, use its default location
+    try:
+        from huggingface_hub.constants import HF_HUB_CACHE
+    except ImportError:
+        return os.path.join(os.path.expanduser("~"), ".cache", "huggingface", "hub")
+    return HF_HUB_CACHE
+
+
+def whisper_model_available(whisper_model_name: str) -> bool:
+    """True if the faster-whisper weights for this model are already in the local cache."""
+    try:
+        mtime_ns = os.stat(_hf_hub_cache()).st_mtime_ns
+    except OSError:
+        # Nothing downloaded yet: skip the snapshot lookup (and its exception path) entirely
+        return False
+
+    key = (whisper_model_name, mtime_ns)
+    hit = _model_available_cache.get(key)
+    if hit is not None:
+        return hit
+
+    try:
+        from faster_whisper import download_model
+
+        download_model(whisper_model_name, local_files_only=True)
+    except Exception:
+        available = False
+    else:
+        available = True
+    _model_available_cache[key] = available
+    return available
+
+
+def generate_srt(
+    video_path: str,
+    whisper_model_name: str,
+    compute_type: str = "auto",
+    workers: int = 1,
+    srt_path: str | None = None,
+    language: str | None = "en",
+) -> Tuple[str, str]:
+    """Run Whisper (faster-whisper / CTranslate2) on a local video file and write a single SRT file.
+
+    compute_type is one of WHISPER_COMPUTE_TYPES; "auto" picks int8 on CPU and
+    int8_float16 (int8 weights, fp16 activations) on GPU. On CPU, workers > 1 splits
+    the audio with ffmpeg and transcribes the pieces in that many processes.
+    srt_path defaults to srt/output.srt next to this module; pass your own when
+    several transcriptions may run at once. language defaults to English, which
+    the concept extraction downstream expects; it also skips Whisper's language
+    detection pass. None detects the language per file (or per shard).
 
     Returns: (srt_path, full_transcript_text)
     """
-    model = whisper.load_model(whisper_model_name)
-    result = model.transcribe(video_path)
+    compute_type, use_cuda = _resolve_compute_type(compute_type)
+
+    if workers > 1 and not use_cuda:
+        segments = _transcribe_sharded(video_path, whisper_model_name, compute_type, workers, language)
+    else:
+        model = _load_whisper(whisper_model_name, compute_type, _cpu_threads(use_cuda))
+        if use_cuda:
+            # GPU: batch VAD-chunked windows so the GPU stays saturated
+            from faster_whisper import BatchedInferencePipeline
+
+            batched = BatchedInferencePipeline(model=model)
+            segments, _info = batched.transcribe(video_path, language=language, beam_size=1, batch_size=16)
+        else:
+            segments, _info = model.transcribe(video_path, language=language, beam_size=1, vad_filter=True)
 
-    srt_dir = os.path.join(APP_DIR, "srt")
-    ensure_dir(srt_dir)
-    srt_path = os.path.join(srt_dir, "output.srt")
+    if srt_path is None:
+        srt_dir = os.path.join(APP_DIR, "srt")
+        ensure_dir(srt_dir)
+        srt_path = os.path.join(srt_dir, "output.srt")
 
-    with open(srt_path, "w", encoding="utf-8") as f:
-        for i, seg in enumerate(result["segments"], 1):
-            f.write(f"{i}\n")
-            f.write(f"{format_srt_time(seg['start'])} --> {format_srt_time(seg['end'])}\n")
-            f.write(seg["text"].strip() + "\n\n")
+    # segments is a lazy generator - transcription happens while we iterate.
+    # Cues stream straight into a 1 MB write buffer; no list of the whole file.
+    # Write to a temp file and swap it in, so hardlinks to a previous
+    # srt_path keep their old contents instead of being truncated.
+    texts: List[str] = []
+    tmp_path = srt_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(_iter_srt(segments, texts))
+    os.replace(tmp_path, srt_path)
 
-    return srt_path, result.get("text", "")
+    return srt_path, " ".join(texts)
 
 
-# -------- Keyword extraction (nouns + proper nouns) --------
-_NLP = None
+def _iter_srt(segments, texts: List[str]):
+    """Yield one formatted SRT cue per segment, collecting the plain text into texts."""
+    for i, seg in enumerate(segments, 1):
+        text = seg.text.strip()
+        texts.append(text)
+        yield f"{i}\n{format_srt_time(seg.start)} --> {format_srt_time(seg.end)}\n{text}\n\n"
 
 
-def _get_nlp():
-    global _NLP
-    if _NLP is None:
-        _NLP = spacy.load("en_core_web_sm")
-    return _NLP
+# -------- Keyword extraction (YAKE! statistical keyphrases) --------
+_KW_RE = re.compile(r"^[a-z0-9][a-z0-9\-\_ ]*$")
 
 
 def extract_keywords(text: str, max_keywords: int) -> List[str]:
-    """Extract up to max_keywords NOUN/PROPN lemmas from text using spaCy."""
-    nlp = _get_nlp()
-    doc = nlp(text)
-    freq = {}
-    for token in doc:
-        if token.is_stop:
-            continue
-        if token.pos_ not in ("NOUN", "PROPN"):
-            continue
-        t = token.lemma_.strip().lower()
-        if len(t) < 3:
+    """Extract up to max_keywords keyphrases (1-2 words) from text using YAKE!.
+
+    No language model is loaded; YAKE! scores candidates from in-document
+    statistics only. Results are best-first.
+    """
+    if max_keywords <= 0 or not text.strip():
+        return []
+
+    # Over-ask a little so the cleanup filter below can't starve the result.
+    extractor = yake.KeywordExtractor(lan="en", n=2, top=max_keywords * 2, dedupLim=0.9)
+
+    out: List[str] = []
+    seen = set()
+    for kw, _score in extractor.extract_keywords(text):
+        t = kw.strip().lower()
+        if len(t) < 3 or t in seen:
             continue
-        if not re.match(r"^[a-z0-9][a-z0-9\-\_ ]*$", t):
+        if not _KW_RE.match(t):
             continue
-        freq[t] = freq.get(t, 0) + 1
-
-    # Sort by frequency then alphabetically for stability.
-    items = sorted(freq.items(), key=lambda kv: (-kv[1], kv[0]))
-    return [k for k, _ in items[:max_keywords]]
+        seen.add(t)
+        out.append(t)
+        if len(out) >= max_keywords:
+            break
+    return out
 
 
 # -------- Google Images scraping via Playwright (real browser window option) --------
+async def _launch_context(p, use_visible_browser: bool, use_existing_profile: bool, chrome_profile_dir: str):
+    """Launch a persistent Chromium context (one browser process, many pages)."""
+    # Use persistent context to better mimic "normal browsing"
+    # and optionally reuse the user's existing Chrome profile (cookies, etc.)
+    launch_args = []
+    if use_visible_browser:
+        launch_args += ["--start-maximized"]
+    else:
+        launch_args += ["--disable-gpu"]
+
+    if use_existing_profile and chrome_profile_dir:
+        user_data_dir = chrome_profile_dir
+    else:
+        # Local persistent profile (still more "real" than stateless context)
+        user_data_dir = os.path.join(APP_DIR, ".playwright_profile")
+
+    return await p.chromium.launch_persistent_context(
+        user_data_dir=user_data_dir,
+        headless=(not use_visible_browser),
+        executable_path=which_browser_executable(),
+        args=launch_args,
+        viewport=None,
+    )
+
+
+@asynccontextmanager
+async def open_browser_context(use_visible_browser: bool, use_existing_profile: bool, chrome_profile_dir: str):
+    """Start Playwright + one persistent browser context for a whole run.
+
+    Pass the yielded context to google_images_download / download_all so every
+    keyword reuses the same browser process instead of cold-starting Chromium.
+    """
+    async with async_playwright() as p:
+        context = await _launch_context(p, use_visible_browser, use_existing_profile, chrome_profile_dir)
+        try:
+            yield context
+        finally:
+            await context.close()
+
+
+def _file_names(path: str) -> frozenset:
+    with os.scandir(path) as it:
+        return frozenset(e.name for e in it)
+
+
+def _prepare_out_dir(out_dir: str) -> None:
+    """Create out_dir and its image_links.txt header if they don't exist yet."""
+    ensure_dir(out_dir)
+
+    # Check if links file exists, if not create it
+    links_file = os.path.join(out_dir, "image_links.txt")
+    if not os.path.exists(links_file):
+        with open(links_file, "w", encoding="utf-8") as f:
+            f.write("# All downloaded image URLs\n")
+            f.write(f"# Generated for job: {os.path.basename(os.path.dirname(out_dir))}\n")
+            f.write("# Format: URL\n\n")
+
+
 async def google_images_download(
     keyword: str,
     out_dir: str,
@@ -149,44 +475,191 @@ async def google_images_download(
     timestamp_based_naming: bool = False,
     timestamps: list = None,
     start_counter: int = 0,
+    context=None,
+    counter_offset: int = 0,
 ) -> int:
-    """Download up to images_needed images for a keyword into out_dir."""
-    ensure_dir(out_dir)
+    """Download up to images_needed images for a keyword into out_dir.
 
-    # Check if links file exists, if not create it
-    links_file = os.path.join(out_dir, "image_links.txt")
-    if not os.path.exists(links_file):
-        with open(links_file, "w", encoding="utf-8") as f:
-            f.write("# All downloaded image URLs\n")
-            f.write(f"# Generated for job: {os.path.basename(os.path.dirname(out_dir))}\n")
-            f.write("# Format: URL\n\n")
-
-    browser_exe = which_browser_executable()
+    If context is given (see download_all) a new tab is opened in it instead of
+    launching a fresh browser. counter_offset is added to counter-based names,
+    so topping up a keyword that already has images doesn't overwrite them.
+    """
+    _prepare_out_dir(out_dir)
 
-    async with async_playwright() as p:
-        # Use persistent context to better mimic "normal browsing"
-        # and optionally reuse the user's existing Chrome profile (cookies, etc.)
-        launch_args = []
-        if use_visible_browser:
-            launch_args += ["--start-maximized"]
-        else:
-            launch_args += ["--disable-gpu"]
+    if context is not None:
+        return await _search_with_retry(
+            context, keyword, out_dir, images_needed, max_scrolls, status_cb,
+            timestamp_based_naming, timestamps, start_counter, counter_offset,
+        )
 
-        if use_existing_profile and chrome_profile_dir:
-            user_data_dir = chrome_profile_dir
-        else:
-            # Local persistent profile (still more "real" than stateless context)
-            user_data_dir = os.path.join(APP_DIR, ".playwright_profile")
-
-        context = await p.chromium.launch_persistent_context(
-            user_data_dir=user_data_dir,
-            headless=(not use_visible_browser),
-            executable_path=browser_exe,
-            args=launch_args,
-            viewport=None,
+    async with open_browser_context(use_visible_browser, use_existing_profile, chrome_profile_dir) as context:
+        return await _search_with_retry(
+            context, keyword, out_dir, images_needed, max_scrolls, status_cb,
+            timestamp_based_naming, timestamps, start_counter, counter_offset,
         )
 
-        page = await context.new_page()
+
+_SEARCH_ATTEMPTS = 3
+_SEARCH_MAX_BACKOFF = 8.0
+
+
+async def _search_with_retry(
+    context,
+    keyword: str,
+    out_dir: str,
+    images_needed: int,
+    max_scrolls: int,
+    status_cb: Callable[[str], None] | None,
+    *naming,
+) -> int:
+    """_search_and_download, retried with exponential back-off on Playwright timeouts.
+
+    Each attempt opens a fresh tab in the same context, so the browser is never
+    relaunched. Other errors propagate immediately.
+    """
+    # Names on disk before the first attempt - an earlier job's images. New files
+    # skip them; a retry still reuses the names of its own failed attempt.
+    taken = await asyncio.to_thread(_file_names, out_dir)
+    delay = 1.0
+    for attempt in range(1, _SEARCH_ATTEMPTS + 1):
+        try:
+            return await _search_and_download(
+                context, keyword, out_dir, images_needed, max_scrolls, status_cb, *naming, taken=taken,
+            )
+        except PlaywrightTimeoutError as e:
+            if attempt == _SEARCH_ATTEMPTS:
+                raise
+            if status_cb:
+                status_cb(f"⏳ Timed out searching '{keyword}' ({e.__class__.__name__}), retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _SEARCH_MAX_BACKOFF)
+
+
+async def download_all(
+    keyword_needs: List[Tuple[str, int]],
+    out_dir: str,
+    max_scrolls: int,
+    use_visible_browser: bool,
+    use_existing_profile: bool,
+    chrome_profile_dir: str,
+    status_cb: Callable[[str], None] | None = None,
+    timestamp_based_naming: bool = False,
+    timestamps: list = None,
+    start_counters: List[int] | None = None,
+    max_concurrency: int = 4,
+    context=None,
+    fallback_suffix: str | None = None,
+    counter_offsets: List[int] | None = None,
+) -> List[int]:
+    """Download images for many keywords concurrently in one browser.
+
+    keyword_needs is a list of (keyword, images_needed). Each keyword gets its own
+    tab; at most max_concurrency tabs run at once. start_counters gives the first
+    timestamp slot per keyword (defaults to back-to-back slots); counter_offsets
+    the number of images a keyword already has in out_dir, so counter-based names
+    continue after them (defaults to 0). If context is given (see
+    open_browser_context) it is used and left open.
+
+    If fallback_suffix is set (e.g. " Wikipedia"), a keyword that comes up short
+    is searched again as keyword + fallback_suffix for the remainder, straight
+    away in the same slot, without waiting for the other keywords.
+
+    Returns the number saved per keyword, fallback included (0 for keywords that failed).
+    """
+    if not keyword_needs:
+        return []
+
+    if start_counters is None:
+        start_counters = []
+        slot = 0
+        for _, need in keyword_needs:
+            start_counters.append(slot)
+            slot += need
+    if counter_offsets is None:
+        counter_offsets = [0] * len(keyword_needs)
+
+    if context is None:
+        async with open_browser_context(use_visible_browser, use_existing_profile, chrome_profile_dir) as ctx:
+            return await download_all(
+                keyword_needs, out_dir, max_scrolls, use_visible_browser, use_existing_profile,
+                chrome_profile_dir, status_cb, timestamp_based_naming, timestamps,
+                start_counters, max_concurrency, context=ctx, fallback_suffix=fallback_suffix,
+                counter_offsets=counter_offsets,
+            )
+
+    # Set up the shared output dir once, before any tab starts writing into it
+    _prepare_out_dir(out_dir)
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def search(keyword: str, need: int, start: int, offset: int) -> int:
+        try:
+            return await _search_with_retry(
+                context, keyword, out_dir, need, max_scrolls, status_cb,
+                timestamp_based_naming, timestamps, start, offset,
+            )
+        except Exception as e:
+            # One bad keyword must not cancel its siblings in the group
+            if status_cb:
+                status_cb(f"❌ Image search failed for '{keyword}': {e}")
+            return 0
+
+    async def one(keyword: str, need: int, start: int, offset: int) -> int:
+        async with sem:
+            got = await search(keyword, need, start, offset)
+            if fallback_suffix and got < need:
+                # Long keywords truncate to the same counter stem as their fallback;
+                # continue the numbering so the fallback can't overwrite them
+                got += await search(f"{keyword}{fallback_suffix}", need - got, start + got, offset + got)
+            return got
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(one(kw, need, start, offset))
+            for (kw, need), start, offset in zip(keyword_needs, start_counters, counter_offsets)
+        ]
+    return [t.result() for t in tasks]
+
+
+# Stylesheets stay enabled: the click fallback and scrolling need a real layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+async def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _search_and_download(
+    context,
+    keyword: str,
+    out_dir: str,
+    images_needed: int,
+    max_scrolls: int,
+    status_cb: Callable[[str], None] | None,
+    timestamp_based_naming: bool,
+    timestamps: list,
+    start_counter: int,
+    counter_offset: int = 0,
+    taken: frozenset = frozenset(),
+) -> int:
+    """Run one Google Images search in a new tab of context and save results.
+
+    Image names in taken (files already in out_dir) are skipped, never overwritten.
+    """
+    page = await context.new_page()
+    # Image URLs are read from the DOM, never rendered - don't let Chromium fetch them
+    await page.route("**/*", _block_heavy_resources)
+    # One pooled (HTTP/2) client per keyword; image GETs are multiplexed over it
+    client = httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": "Mozilla/5.0"},
+        timeout=15,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=16),
+    )
+    try:
         await page.goto("https://www.google.com/imghp?hl=en", wait_until="domcontentloaded")
 
         # Search - try multiple selectors for Google Images search input
@@ -223,10 +696,128 @@ async def google_images_download(
             if status_cb:
                 status_cb(msg)
 
+        links_path = os.path.join(out_dir, "image_links.txt")
+
+        # Everything but the timestamp / counter, computed once rather than per saved image
+        safe_keyword = keyword.translate(KEYWORD_FILENAME_TABLE)
+        ts_keyword, counter_keyword = safe_keyword[:30], safe_keyword[:20]  # Limit length
+        dir_prefix = os.path.join(out_dir, "")  # out_dir + separator
+        ts_suffix = f"_{ts_keyword}.jpg"
+        counter_prefix = f"{counter_keyword}_"
+        n_timestamps = len(timestamps) if timestamp_based_naming and timestamps else 0
+        slot = start_counter
+        counter = counter_offset
+
+        def image_filename() -> str:
+            # Generate filename based on timestamp or counter, past names already taken
+            nonlocal slot, counter
+            while slot < n_timestamps:
+                name = f"{timestamps[slot]}{ts_suffix}"
+                slot += 1
+                if name not in taken:
+                    return dir_prefix + name
+            # Fallback: use concept name + counter
+            counter = max(counter, counter_offset + saved)
+            while True:
+                counter += 1
+                name = f"{counter_prefix}{counter:02d}.jpg"
+                if name not in taken:
+                    return dir_prefix + name
+
+        async def save_batch(urls: List[str]) -> None:
+            """Fetch urls concurrently, then validate and save in order until we have enough."""
+            set_status(f"Finding high-quality images: {saved}/{images_needed} found for '{keyword}'")
+            results = await asyncio.gather(*[_fetch_image(client, u) for u in urls])
+            saved_urls: List[str] = []
+            try:
+                await save_results(urls, results, saved_urls)
+            finally:
+                # URLs of everything saved, written to the links file in one go
+                await asyncio.to_thread(_append_lines, links_path, saved_urls)
+
+        async def save_results(urls: List[str], results, saved_urls: List[str]) -> None:
+            """Save fetched results in order, recording each saved URL in saved_urls."""
+            nonlocal saved
+            for url, (content, duplicate_of, digest) in zip(urls, results):
+                if saved >= images_needed:
+                    break
+
+                if duplicate_of is not None:
+                    # Same bytes already saved this session (any keyword): link, don't re-download
+                    target = image_filename()
+                    if duplicate_of != target:  # a retried search can land on its own earlier file
+                        await asyncio.to_thread(link_or_copy, duplicate_of, target)
+                    saved += 1
+                    set_status(f"♻️ Reused identical image for '{keyword}' ({saved}/{images_needed})")
+                    saved_urls.append(url)
+                    continue
+
+                if content is None:
+                    continue
+
+                # Check if it's actually a valid image with reasonable dimensions
+                try:
+                    # Try to open as image to validate
+                    img = Image.open(io.BytesIO(content))
+                    width, height = img.size
+                except Exception:
+                    # If PIL can't open it, still save if it's reasonably sized
+                    if len(content) <= 5000:  # Fallback to 5KB minimum
+                        set_status(f"⏭️ Skipped invalid/unreadable image for '{keyword}'")
+                        continue
+                    filename = image_filename()
+                    await asyncio.to_thread(_write_bytes, filename, content)
+                    _seen_image_hashes[digest] = filename
+                    saved += 1
+                    set_status(f"✅ Saved image for '{keyword}' ({saved}/{images_needed})")
+                else:
+                    # Skip if image is too small (likely low quality or icon)
+                    min_dimension = 200  # Minimum 200px on smallest side
+                    if width < min_dimension or height < min_dimension:
+                        set_status(f"⏭️ Skipped low-quality {width}x{height} image for '{keyword}' (continuing search...)")
+                        continue
+                    filename = image_filename()
+                    await asyncio.to_thread(_write_bytes, filename, content)
+                    _seen_image_hashes[digest] = filename
+                    saved += 1
+                    set_status(f"✅ Saved high-quality {width}x{height} image for '{keyword}' ({saved}/{images_needed})")
+
+                # Save URL to links file
+                saved_urls.append(url)
+
+        async def grid_image_urls() -> List[str]:
+            """Original image URLs Google embeds in result links (/imgres?imgurl=...)"""
+            try:
+                urls = await page.eval_on_selector_all(
+                    "a[href*='/imgres?']",
+                    "els => els.map(e => { try { return new URL(e.href).searchParams.get('imgurl'); }"
+                    " catch (_) { return null; } })",
+                )
+            except Exception:
+                return []
+            return [u for u in urls if u and u.startswith("http") and "gstatic.com" not in u]
+
+        pending: List[str] = []
         set_status(f"Searching images for: {keyword}")
 
-        # Main loop: scroll + click thumbnails to get original URLs
+        # Main loop: scroll, read URLs off the grid, click thumbnails only if still short
         for scroll_i in range(max_scrolls):
+            # Fast path: no clicks, no side panel - just the links already in the DOM
+            grid_urls = []
+            for u in await grid_image_urls():
+                key = _normalize_image_url(u)
+                if key not in seen:
+                    seen.add(key)
+                    grid_urls.append(u)
+            while grid_urls and saved < images_needed:
+                # Over-fetch 2x per wave to absorb rejects
+                wave_size = 2 * (images_needed - saved)
+                await save_batch(grid_urls[:wave_size])
+                grid_urls = grid_urls[wave_size:]
+
+            if saved >= images_needed:
+                break
+
             # Thumbnails currently in DOM - try multiple selectors
             thumb_selectors = [
                 "img.Q4LuWd",
@@ -306,62 +897,19 @@ async def google_images_download(
                             url = src
                             break
 
-                if not url or url in seen:
+                if not url or _normalize_image_url(url) in seen:
                     continue
 
-                seen.add(url)
-                # Generate filename based on timestamp or counter
-                if timestamp_based_naming and timestamps and (start_counter + saved) < len(timestamps):
-                    timestamp = timestamps[start_counter + saved]
-                    safe_keyword = keyword.replace(' ', '_').replace('/', '_')[:30]  # Limit length
-                    filename = os.path.join(out_dir, f"{timestamp}_{safe_keyword}.jpg")
-                else:
-                    # Fallback: use concept name + counter
-                    safe_keyword = keyword.replace(' ', '_').replace('/', '_')[:20]  # Limit length
-                    filename = os.path.join(out_dir, f"{safe_keyword}_{saved+1:02d}.jpg")
-                try:
-                    set_status(f"Finding high-quality images: {saved}/{images_needed} found for '{keyword}'")
-                    r = requests.get(url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
-                    if r.status_code == 200 and len(r.content) > 2000:  # Minimum 2KB
-                        # Check if it's actually a valid image with reasonable dimensions
-                        try:
-                            from PIL import Image
-                            import io
-
-                            # Try to open as image to validate
-                            img = Image.open(io.BytesIO(r.content))
-                            width, height = img.size
-
-                            # Skip if image is too small (likely low quality or icon)
-                            min_dimension = 200  # Minimum 200px on smallest side
-                            if width >= min_dimension and height >= min_dimension:
-                                with open(filename, "wb") as f:
-                                    f.write(r.content)
-                                saved += 1
-                                set_status(f"✅ Saved high-quality {width}x{height} image for '{keyword}' ({saved}/{images_needed})")
-
-                                # Save URL to links file
-                                links_file = os.path.join(out_dir, "image_links.txt")
-                                with open(links_file, "a", encoding="utf-8") as f:
-                                    f.write(f"{url}\n")
-                            else:
-                                set_status(f"⏭️ Skipped low-quality {width}x{height} image for '{keyword}' (continuing search...)")
-                        except Exception:
-                            # If PIL can't open it, still save if it's reasonably sized
-                            if len(r.content) > 5000:  # Fallback to 5KB minimum
-                                with open(filename, "wb") as f:
-                                    f.write(r.content)
-                                saved += 1
-                                set_status(f"✅ Saved image for '{keyword}' ({saved}/{images_needed})")
-
-                                # Save URL to links file
-                                links_file = os.path.join(out_dir, "image_links.txt")
-                                with open(links_file, "a", encoding="utf-8") as f:
-                                    f.write(f"{url}\n")
-                            else:
-                                set_status(f"⏭️ Skipped invalid/unreadable image for '{keyword}'")
-                except Exception:
-                    continue
+                seen.add(_normalize_image_url(url))
+                pending.append(url)
+                # Fetch a wave as soon as we have enough candidates for what's still missing
+                if len(pending) >= images_needed - saved:
+                    await save_batch(pending)
+                    pending = []
+
+            if pending and saved < images_needed:
+                await save_batch(pending)
+            pending = []
 
             if saved >= images_needed:
                 break
@@ -370,26 +918,138 @@ async def google_images_download(
             await page.mouse.wheel(0, 1200)
             await page.wait_for_timeout(700)
 
-        await context.close()
         return saved
+    finally:
+        await client.aclose()
+        await page.close()
+
+
+_MIN_IMAGE_BYTES = 2000  # Minimum 2KB
+_MAX_IMAGE_BYTES = 8_000_000
+_HASH_PREFIX_BYTES = 16 * 1024
+
+# Session-wide: xxh3 of an image's first 16 KB -> file it was saved as
+_seen_image_hashes: dict[int, str] = {}
+
+# Query params CDNs use for on-the-fly resizing; same image, different URL
+_RESIZE_PARAMS = frozenset({"w", "h", "width", "height", "resize", "fit", "crop", "quality", "q", "dpr", "fm", "auto"})
+
+
+def _normalize_image_url(url: str) -> str:
+    """URL used for seen-checks: resize/format query params dropped."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in _RESIZE_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query), fragment=""))
+
+
+async def _fetch_image(client: "httpx.AsyncClient", url: str) -> Tuple[bytes | None, str | None, int | None]:
+    """GET an image URL.
+
+    Returns (body, duplicate_of, digest). body is None if the fetch failed or the
+    response doesn't look usable. Headers are checked before the body is pulled, so
+    HTML error pages and oversized files are dropped without downloading them.
+    If the first 16 KB match an image already saved this session, the transfer is
+    aborted and duplicate_of is that file's path.
+    """
+    digest = None
+    try:
+        async with client.stream("GET", url) as r:
+            if r.status_code != 200:
+                return None, None, None
+            ct = r.headers.get("content-type", "").lower()
+            if ct and not (ct.startswith("image/") or ct.startswith("application/octet-stream")):
+                return None, None, None
+            cl = int(r.headers.get("content-length", "0") or 0)
+            if cl and (cl < _MIN_IMAGE_BYTES or cl > _MAX_IMAGE_BYTES):
+                return None, None, None
+
+            # Content-Length can be missing or wrong; cap what we actually read.
+            chunks: List[bytes] = []
+            total = 0
+            async for chunk in r.aiter_bytes():
+                total += len(chunk)
+                if total > _MAX_IMAGE_BYTES:
+                    return None, None, None
+                chunks.append(chunk)
+                if digest is None and total >= _HASH_PREFIX_BYTES:
+                    digest = xxhash.xxh3_64_intdigest(b"".join(chunks)[:_HASH_PREFIX_BYTES])
+                    existing = _seen_image_hashes.get(digest)
+                    if existing and os.path.exists(existing):
+                        return None, existing, digest
+    except Exception:
+        return None, None, None
+
+    if total <= _MIN_IMAGE_BYTES:
+        return None, None, None
+    data = b"".join(chunks)
+    if digest is None:
+        digest = xxhash.xxh3_64_intdigest(data)
+        existing = _seen_image_hashes.get(digest)
+        if existing and os.path.exists(existing):
+            return None, existing, digest
+    return data, None, digest
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, replacing any existing dst; copy if linking isn't possible."""
+    try:
+        if os.path.samefile(src, dst):
+            return
+    except OSError:
+        pass
+    # Link to a temp name and swap it in, so an existing dst (possibly a
+    # hardlink to another image) is replaced rather than written through
+    tmp = dst + ".tmp"
+    try:
+        os.unlink(tmp)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, tmp)
+    except OSError:
+        # Cross-device or no hardlink support
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    # Never open an existing path for writing: it may be a hardlink shared
+    # with another image
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _append_lines(path: str, lines: List[str]) -> None:
+    """Append lines to path in a single O_APPEND write.
+
+    Tabs for different keywords share image_links.txt; one write() per batch
+    keeps each batch's lines together without a lock.
+    """
+    if not lines:
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, "".join(f"{line}\n" for line in lines).encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+# Index lines and timestamp lines (anything containing "-->"), plus their newline
+_SRT_STRIP_RE = re.compile(rb"(?m)^(?:\d+[ \t]*\r?|.*-->.*)$\n?")
 
 
 def srt_file_to_text(srt_path: str) -> str:
     """Convert an .srt file into plain text by stripping indices/timestamps."""
-    lines: List[str] = []
-    with open(srt_path, "r", encoding="utf-8") as f:
-        for raw in f:
-            line = raw.rstrip("\n")
-            if not line:
-                continue
-            # Skip numeric indices
-            if re.match(r"^\d+$", line):
-                continue
-            # Skip timestamp lines
-            if "-->" in line:
-                continue
-            lines.append(line.strip())
-    return " ".join(lines)
+    with open(srt_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            cleaned = _SRT_STRIP_RE.sub(b"", mm)
+    return " ".join(cleaned.decode("utf-8", "ignore").split())
 
 
 def compute_keyword_image_targets(
@@ -401,6 +1061,16 @@ def compute_keyword_image_targets(
     Returns list of (keyword, images_needed).
     Tries to ensure at least min_images_per_srt overall, but respects max_total_images.
     """
+    return list(iter_keyword_image_targets(text, settings))
+
+
+def iter_keyword_image_targets(text: str, settings: dict) -> Iterator[Tuple[str, int]]:
+    """Lazy form of compute_keyword_image_targets: yields (keyword, images_needed).
+
+    Keywords are extracted up front (the per-keyword share depends on how many
+    there are); the allocation is then handed out one keyword at a time, so a
+    consumer can start the first download without waiting for the whole list.
+    """
     max_keywords = int(settings.get("max_keywords", 20))
     per_kw_default = int(settings.get("images_per_keyword", 3))
     max_total = int(settings.get("max_total_images", 60))
@@ -408,7 +1078,7 @@ def compute_keyword_image_targets(
 
     keywords = extract_keywords(text, max_keywords)
     if not keywords:
-        return []
+        return
 
     # First-pass simple allocation
     total_if_default = per_kw_default * len(keywords)
@@ -419,15 +1089,9 @@ def compute_keyword_image_targets(
     per_kw = min(per_kw, max_total)  # hard safety
 
     remaining = max_total
-    out: List[Tuple[str, int]] = []
     for kw in keywords:
         if remaining <= 0:
-            break
+            return
         need = min(per_kw, remaining)
-        out.append((kw, need))
+        yield kw, need
         remaining -= need
-
-    return out
-
-
-
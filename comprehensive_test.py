@@ -7,7 +7,8 @@ import os
 import asyncio
 import json
 from unified_app import UnifiedApp, Platform, Job
-from broll_core import generate_srt
+from broll_core import APP_DIR, generate_srt, is_image_file, link_or_copy
+
 
 async def test_full_pipeline():
     """Test the complete application pipeline"""
@@ -53,18 +54,17 @@ async def test_full_pipeline():
             generated_srt, transcript = generate_srt(video_path, "base")
             print(f"✅ SRT generated successfully: {len(transcript)} characters")
 
-            # Copy to test location
+            # Link into the test location (falls back to a copy across filesystems)
             if os.path.exists(generated_srt):
-                import shutil
-                shutil.copy2(generated_srt, srt_path)
-                print(f"✅ SRT copied to: {srt_path}")
+                link_or_copy(generated_srt, srt_path)
+                print(f"✅ SRT linked or copied to: {srt_path}")
 
         except Exception as e:
             print(f"❌ SRT generation failed: {e}")
             # Use existing SRT if generation fails
             existing_srt = "/home/admin/Downloads/love__war__batch_2026-01-06_04-51-27/I_Built_a_Self_Landing_Satellite [7yVFZn87TkY].en.srt"
             if os.path.exists(existing_srt):
-                shutil.copy2(existing_srt, srt_path)
+                link_or_copy(existing_srt, srt_path)
                 print(f"✅ Using existing SRT: {srt_path}")
     else:
         print("❌ Video file not found")
@@ -78,7 +78,7 @@ async def test_full_pipeline():
         with open(srt_path, 'r', encoding='utf-8') as f:
             srt_content = f.read()
 
-        extractor = NLPConceptExtractor()
+        extractor = NLPConceptExtractor(cache_dir=os.path.join(APP_DIR, "cache", "concepts"))
         concepts = extractor.extract_concepts(srt_content, max_concepts=8)
 
         print(f"✅ Extracted {len(concepts)} concepts: {concepts[:5]}...")
@@ -136,8 +136,8 @@ async def test_full_pipeline():
 
         # Check files
         if os.path.exists(test_output):
-            files = os.listdir(test_output)
-            image_files = [f for f in files if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
+            with os.scandir(test_output) as it:
+                image_files = [e.name for e in it if is_image_file(e.name)]
             print(f"✅ Image files created: {len(image_files)}")
 
             if len(image_files) >= 2:
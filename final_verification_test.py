@@ -6,7 +6,9 @@ Final verification that all issues are resolved
 import os
 import asyncio
 from unified_app import UnifiedApp, JobProcessor, Platform, Job
-from broll_core import load_settings, generate_srt, google_images_download
+from broll_core import (
+    load_settings, generate_srt, google_images_download, is_image_file, link_or_copy, preload_whisper,
+)
 
 async def final_test():
     print("🧪 FINAL VERIFICATION TEST")
@@ -50,9 +52,9 @@ async def final_test():
         if hasattr(processor, '_extract_srt_timestamps'):
             print("✅ JobProcessor has _extract_srt_timestamps method")
 
-            # Test with actual SRT directory
-            test_dir = "/home/admin/Downloads/love__war__batch_2026-01-06_04-51-27"
-            timestamps = processor._extract_srt_timestamps(test_dir)
+            # Test with the actual SRT that ships next to the video (Test 3 only writes final_test.srt later)
+            test_srt = "/home/admin/Downloads/love__war__batch_2026-01-06_04-51-27/I_Built_a_Self_Landing_Satellite [7yVFZn87TkY].en.srt"
+            timestamps = processor._extract_srt_timestamps(test_srt)
 
             print(f"✅ Extracted {len(timestamps)} timestamps from SRT")
             if timestamps:
@@ -77,14 +79,14 @@ async def final_test():
         test_srt_path = os.path.join(srt_dir, "final_test.srt")
 
         if os.path.exists(video_path):
+            preload_whisper("base")  # load once per process; generate_srt reuses it
             srt_path, transcript = generate_srt(video_path, "base")
             print(f"✅ SRT generation successful: {len(transcript)} characters")
 
-            # Copy for testing
-            if os.path.exists(srt_path):
-                import shutil
-                shutil.copy2(srt_path, test_srt_path)
-                print("✅ SRT file copied for testing")
+            # generate_srt writes under APP_DIR/srt/: hardlinked if that's on the
+            # same filesystem as the test dir, copied otherwise
+            link_or_copy(srt_path, test_srt_path)
+            print("✅ SRT file linked or copied for testing")
         else:
             print("⚠️ Video file not found, skipping SRT generation test")
 
@@ -127,8 +129,8 @@ async def final_test():
             print(f"✅ Image download works! Total: {total_downloaded} images")
 
             # Check files
-            files = os.listdir(test_output)
-            image_files = [f for f in files if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
+            with os.scandir(test_output) as it:
+                image_files = [e.name for e in it if is_image_file(e.name) and e.is_file()]
             print(f"📁 Created {len(image_files)} image files")
 
             if image_files:
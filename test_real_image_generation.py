@@ -4,9 +4,47 @@ Test real image generation from the user's SRT file
 """
 
 import os
+import re
 import asyncio
+import functools
 from unified_app import NLPConceptExtractor
-from broll_core import google_images_download
+from broll_core import (
+    APP_DIR, KEYWORD_FILENAME_TABLE, google_images_download, is_image_file, srt_file_to_text,
+)
+
+
+def _indent_cb(msg, _p="    "):
+    # Straight to stdout, in order with the script's own print()s
+    print(_p + msg, flush=True)
+
+
+_wiki_indent_cb = functools.partial(_indent_cb, _p="      ")
+
+
+def _count_existing_images(out_dir, concept):
+    """Count images in out_dir already saved for concept (Google or Wikipedia search).
+
+    Only counter-named files count. Concepts that agree on their first 20
+    characters share a stem (broll_core truncates it) and can't be told apart.
+    """
+    # Exact shape image_filename() in broll_core uses for counter-named files:
+    # "<stem>_NN.jpg", so "Mars" doesn't also match "Mars_Rover_01.jpg"
+    stems = {kw.translate(KEYWORD_FILENAME_TABLE)[:20] for kw in (concept, f"{concept} Wikipedia")}
+    counter_name = re.compile(r"(?:%s)_\d{2,}\.jpg" % "|".join(map(re.escape, stems))).fullmatch
+    with os.scandir(out_dir) as it:
+        return sum(1 for e in it if counter_name(e.name))
+
+
+def _read_images(out_dir):
+    """Bytes of every image in out_dir, by file name."""
+    with os.scandir(out_dir) as it:
+        paths = [e.path for e in it if is_image_file(e.name)]
+    images = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            images[os.path.basename(path)] = f.read()
+    return images
+
 
 async def test_real_image_generation():
     """Test the complete image generation pipeline"""
@@ -17,18 +55,17 @@ async def test_real_image_generation():
     srt_path = '/home/admin/Downloads/love__war__batch_2026-01-06_04-51-27/I_Built_a_Self_Landing_Satellite [7yVFZn87TkY].en.srt'
     output_dir = '/home/admin/Downloads/love__war__batch_2026-01-06_04-51-27'
 
-    if not os.path.exists(srt_path):
+    # Read SRT as plain transcript text (indices/timestamps stripped in one pass)
+    try:
+        srt_content = srt_file_to_text(srt_path)
+    except FileNotFoundError:
         print(f"❌ SRT file not found: {srt_path}")
         return False
 
-    # Read SRT
-    with open(srt_path, 'r', encoding='utf-8') as f:
-        srt_content = f.read()
-
-    print(f"📄 Loaded SRT: {len(srt_content)} characters")
+    print(f"📄 Loaded SRT: {len(srt_content)} characters of transcript text")
 
     # Extract concepts
-    extractor = NLPConceptExtractor()
+    extractor = NLPConceptExtractor(cache_dir=os.path.join(APP_DIR, "cache", "concepts"))
     concepts = extractor.extract_concepts(srt_content, max_concepts=5)  # Test with fewer concepts
 
     print(f"🧠 Extracted {len(concepts)} concepts: {concepts}")
@@ -44,38 +81,50 @@ async def test_real_image_generation():
     print(f"📁 Test output directory: {test_output}")
 
     total_images = 0
+    # A top-up run must add files, never rewrite ones an earlier run saved
+    before = _read_images(test_output)
 
     # Test image generation for first 2 concepts
     for i, concept in enumerate(concepts[:2]):
         print(f"🖼️  Testing concept {i+1}/2: '{concept}'")
 
+        # Re-runs: images from a previous run are still there, skip the scrape
+        existing = _count_existing_images(test_output, concept)
+        if existing >= 2:
+            print(f"    ⏭️  {existing} images already present for '{concept}', skipping download")
+            total_images += 2
+            continue
+
         try:
             # Test Google search (background mode)
             saved = await google_images_download(
                 keyword=concept,
                 out_dir=test_output,
-                images_needed=2,  # Just 2 images for testing
+                images_needed=2 - existing,  # Just 2 images for testing
                 max_scrolls=3,  # Fewer scrolls for testing
                 use_visible_browser=False,
                 use_existing_profile=False,
                 chrome_profile_dir="",
-                status_cb=lambda msg: print(f"    {msg}")
+                status_cb=_indent_cb,
+                counter_offset=existing,  # number after images from a previous run
             )
 
             # If Google didn't get enough, try Wikipedia
             wiki_saved = 0
-            if saved < 2:
+            if saved < 2 - existing:
                 wiki_keyword = f"{concept} Wikipedia"
                 print(f"    Trying Wikipedia: '{wiki_keyword}'")
                 wiki_saved = await google_images_download(
                     keyword=wiki_keyword,
                     out_dir=test_output,
-                    images_needed=2 - saved,
+                    images_needed=2 - existing - saved,
                     max_scrolls=3,
                     use_visible_browser=False,
                     use_existing_profile=False,
                     chrome_profile_dir="",
-                    status_cb=lambda msg: print(f"      {msg}")
+                    status_cb=_wiki_indent_cb,
+                    # Concepts of 20+ characters share Google's counter stem; don't overwrite its images
+                    counter_offset=existing + saved,
                 )
 
             total_saved = saved + wiki_saved
@@ -89,10 +138,18 @@ async def test_real_image_generation():
     print("\n📊 Results:")
     print(f"Total images downloaded: {total_images}")
 
+    after = _read_images(test_output)
+    changed = [name for name, data in before.items() if after.get(name) != data]
+    if changed:
+        print(f"❌ FAILURE: {len(changed)} images from a previous run were overwritten or removed: {changed[:3]}")
+        return False
+    if before:
+        print(f"✅ {len(before)} images from a previous run left unchanged")
+
     # List downloaded files
     if os.path.exists(test_output):
-        files = os.listdir(test_output)
-        image_files = [f for f in files if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
+        with os.scandir(test_output) as it:
+            image_files = [e.name for e in it if is_image_file(e.name)]
         print(f"Image files found: {len(image_files)}")
 
         if image_files:
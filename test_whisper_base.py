@@ -4,7 +4,8 @@ Test SRT generation with Whisper base model
 """
 
 import os
-from broll_core import generate_srt
+import time
+from broll_core import generate_srt, preload_whisper
 
 def test_whisper_base():
     print("🎤 Testing SRT generation with Whisper 'base' model...")
@@ -19,6 +20,11 @@ def test_whisper_base():
     print(f"📹 Found video: {os.path.basename(video_path)}")
 
     try:
+        # Warm the model once so the timing below is inference only
+        t0 = time.perf_counter()
+        preload_whisper("base")
+        print(f"🔥 Whisper 'base' loaded in {time.perf_counter() - t0:.1f}s")
+
         print("⏳ Generating SRT with Whisper 'base' model...")
         print("   (This may take a minute...)")
 
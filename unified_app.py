@@ -7,32 +7,94 @@ Fast, sequential pipeline for video creation with smart image concept extraction
 import os
 import sys
 import json
+import subprocess
 import time
+import hashlib
 import threading
 import queue
+from collections import deque
 import asyncio
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
+from contextlib import AsyncExitStack, asynccontextmanager
 import re
 
-# Core dependencies
-import whisper
-import spacy
-import requests
-from playwright.async_api import async_playwright
+# Core dependencies. spaCy is imported where it's used (_get_nlp and the Doc
+# cache), so the window comes up without waiting on it; Playwright lives in broll_core.
+import orjson
 
 # Local modules
 from broll_core import (
-    generate_srt, extract_keywords, compute_keyword_image_targets,
-    google_images_download, safe_folder_name, ensure_dir,
-    which_browser_executable, load_settings, save_settings
+    APP_DIR, generate_srt, extract_keywords, compute_keyword_image_targets,
+    download_all, open_browser_context, safe_folder_name, ensure_dir,
+    which_browser_executable, load_settings, save_settings,
+    read_settings_json, write_settings_json, srt_file_to_text, WHISPER_COMPUTE_TYPES,
+    preload_whisper, whisper_model_available, whisper_parallelism,
 )
 
 
+# Whisper model sizes, smallest first
+_WHISPER_RANK = {"tiny": 0, "base": 1, "small": 2, "medium": 3, "large": 4}
+_WHISPER_MODELS = tuple(_WHISPER_RANK)
+
+# App-level settings defaults; settings.json overrides these on load and the
+# settings dialog's Reset restores them.
+APP_DEFAULT_SETTINGS: Dict[str, Any] = {
+    "whisper_model": "base",
+    "whisper_compute_type": "auto",
+    "whisper_workers": 1,
+    "images_per_concept": 3,
+    "max_concepts_per_srt": 15,
+    "max_total_images": 50,
+    "max_scrolls_per_keyword": 6,
+    "max_parallel_keywords": 4,
+    "max_parallel_jobs": 2,
+    "use_visible_browser": True,
+    "use_existing_chrome_profile": False,
+    "chrome_profile_dir": "",
+    "srt_youtube_enabled": False,
+    "srt_other_enabled": False,
+}
+
+# Browser profile locations under the home directory, per platform.system(),
+# in the order the settings dialog's Auto button tries them
+_PROFILE_SUFFIXES: Dict[str, Tuple[str, ...]] = {
+    "Linux": (
+        ".config/google-chrome",
+        ".config/chromium",
+        ".mozilla/firefox",
+    ),
+    "Darwin": (
+        "Library/Application Support/Google/Chrome",
+        "Library/Application Support/Chromium",
+        "Library/Application Support/Firefox/Profiles",
+    ),
+    "Windows": (
+        "AppData/Local/Google/Chrome/User Data",
+        "AppData/Local/Chromium/User Data",
+        "AppData/Roaming/Mozilla/Firefox/Profiles",
+    ),
+}
+
+
+def _open_in_file_manager(path: str) -> None:
+    """Open path in the desktop file manager without blocking the caller"""
+    if sys.platform == "win32":
+        os.startfile(path)
+        return
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    subprocess.Popen(
+        [opener, path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+    )
+
+
 class JobStatus(Enum):
     QUEUED = "queued"
     DOWNLOADING = "downloading"
@@ -43,6 +105,18 @@ class JobStatus(Enum):
     ERROR = "error"
 
 
+# Job list prefix per status
+_STATUS_EMOJI = {
+    JobStatus.QUEUED: "⏳",
+    JobStatus.DOWNLOADING: "⬇️",
+    JobStatus.TRANSCRIBING: "🎤",
+    JobStatus.ANALYZING: "🔍",
+    JobStatus.IMAGES: "🖼️",
+    JobStatus.DONE: "✅",
+    JobStatus.ERROR: "❌",
+}
+
+
 class Platform(Enum):
     YOUTUBE = "youtube"
     TIKTOK = "tiktok"
@@ -50,6 +124,24 @@ class Platform(Enum):
     OTHER = "other"
 
 
+def _host_re(domains: str) -> "re.Pattern[str]":
+    # Scheme optional, any subdomain, then the domain must end the hostname
+    return re.compile(rf"^(?:https?://)?(?:[\w-]+\.)*(?:{domains})(?::\d+)?(?:[/?#]|$)", re.I)
+
+
+_PLATFORM_URL_RE = {
+    Platform.TIKTOK: _host_re(r"tiktok\.com"),
+    Platform.YOUTUBE: _host_re(r"youtube\.com|youtu\.be"),
+    Platform.INSTAGRAM: _host_re(r"instagram\.com"),
+}
+
+
+def url_matches_platform(url: str, platform: Platform) -> bool:
+    """True if url is hosted on platform (any URL matches Platform.OTHER)"""
+    pattern = _PLATFORM_URL_RE.get(platform)
+    return pattern is None or pattern.match(url.strip()) is not None
+
+
 @dataclass
 class Job:
     id: str
@@ -67,68 +159,211 @@ class Job:
 
     def __post_init__(self):
         if not self.id:
-            self.id = f"{int(time.time())}_{hash(self.url) % 10000}"
+            # blake2b, not hash(): stable across runs (no PYTHONHASHSEED salt)
+            # and 48 bits instead of 10,000 buckets
+            url_key = hashlib.blake2b(self.url.encode("utf-8"), digest_size=6).hexdigest()
+            self.id = f"{int(time.time())}_{url_key}"
+
+
+# yt-dlp progress lines, e.g. "[download]  42.3% of 10.00MiB at ..."
+_YTDLP_PROGRESS_RE = re.compile(rb"\[download\]\s+(\d+(?:\.\d+)?)%")
+
+# SRT index lines and timestamp lines (anything containing "-->")
+_SRT_CUE_RE = re.compile(r'^[ \t]*(?:\d+|.*-->.*)[ \t\r]*$', re.MULTILINE)
+
+# Sentence scoring: lemma -> weight for visual, emotion and action cue words
+_VISUAL_WORDS = frozenset({
+    'see', 'look', 'watch', 'view', 'appear', 'show', 'display',
+    'imagine', 'picture', 'visual', 'scene', 'image', 'photo',
+    'building', 'place', 'location', 'city', 'country', 'world'
+})
+_EMOTION_WORDS = frozenset({
+    'amazing', 'beautiful', 'stunning', 'incredible', 'awesome',
+    'terrible', 'horrible', 'scary', 'exciting', 'dramatic'
+})
+_ACTION_WORDS = frozenset({
+    'fight', 'battle', 'war', 'revolution', 'change', 'transform',
+    'build', 'create', 'destroy', 'discover', 'invent', 'explore'
+})
+_CUE_WORD_WEIGHTS = {
+    **dict.fromkeys(_VISUAL_WORDS, 0.3),
+    **dict.fromkeys(_EMOTION_WORDS, 0.2),
+    **dict.fromkeys(_ACTION_WORDS, 0.2),
+}
+_SCORE_ENT_LABELS = frozenset({'PERSON', 'ORG', 'GPE', 'LOC', 'EVENT'})
+# Entity labels taken as concepts by the first (entity-only) pass
+_CONCEPT_ENT_LABELS = _SCORE_ENT_LABELS | {'PRODUCT', 'WORK_OF_ART'}
+
+def _norm_concept(concept: str) -> str:
+    """Case- and whitespace-insensitive key for concept dedupe"""
+    return ' '.join(concept.lower().split())
+
+
+def _drop_contained_concepts(concepts: List[str]) -> List[str]:
+    """Drop concepts whose words appear inside a longer kept concept ("Napoleon" vs
+    "Napoleon Bonaparte"), so both don't trigger the same image search. Order is kept."""
+    kept: List[str] = []
+    for norm in sorted({_norm_concept(c) for c in concepts}, key=len, reverse=True):
+        if not any(f" {norm} " in f" {longer} " for longer in kept):
+            kept.append(norm)
+    keep = set(kept)
+    return [c for c in concepts if _norm_concept(c) in keep]
+
+
+# Components only the noun-phrase pass needs (noun_chunks, lemma scoring);
+# they run on demand, after the entity pass has had its chance to fill the quota
+_SECOND_PASS_PIPES = ("parser", "lemmatizer")
+
+def _ents_within(ents, sentences) -> Iterator:
+    """Yield the entities that lie wholly inside one of sentences, in document order.
+
+    Both are sorted by position, so this is one merged sweep; Span.ents would
+    rescan every entity in the Doc for each sentence. Stops when the caller does.
+    """
+    i, n = 0, len(ents)
+    for sent in sentences:
+        while i < n and ents[i].start < sent.start:
+            i += 1
+        while i < n and ents[i].start < sent.end:
+            ent = ents[i]
+            i += 1
+            if ent.end <= sent.end:  # not running on into the next sentence
+                yield ent
+
+
+_NLP_CACHE: Dict[str, "spacy.Language"] = {}
+_NLP_LOCK = threading.Lock()
+
+
+def _get_nlp(model_name: str = "en_core_web_sm"):
+    """Load a spaCy pipeline once per process; every NLPConceptExtractor shares it.
+
+    senter is left out of nlp.pipeline; NLPConceptExtractor calls it directly
+    alongside the other components it needs. The lock keeps job worker
+    threads from loading the same model twice.
+    """
+    with _NLP_LOCK:
+        nlp = _NLP_CACHE.get(model_name)
+        if nlp is None:
+            import spacy
+
+            nlp = _NLP_CACHE[model_name] = spacy.load(model_name, disable=["senter"])
+            # The whole transcript is parsed as one Doc; allow long lectures
+            nlp.max_length = 2_000_000
+        return nlp
 
 
 class NLPConceptExtractor:
     """Smart concept extraction using spaCy + scoring"""
 
-    def __init__(self):
+    # Bump whenever extraction logic changes so old on-disk cache entries are ignored
+    CACHE_VERSION = "4"
+
+    def __init__(self, cache_dir: Optional[str] = None):
         self.nlp = None
+        # Optional: directory for results keyed by sha1(srt_text) + max_concepts,
+        # plus parsed Docs (docs/) keyed by the cleaned text
+        self.cache_dir = cache_dir
 
     def _load_model(self):
         if self.nlp is None:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = _get_nlp("en_core_web_sm")
 
     def extract_concepts(self, srt_text: str, max_concepts: int = 20) -> List[str]:
+        """Extract smart visual concepts from SRT text (served from cache_dir if set)"""
+        if not self.cache_dir:
+            return self._extract_concepts_uncached(srt_text, max_concepts)
+
+        key = hashlib.sha1(srt_text.encode("utf-8")).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"{key}_{max_concepts}_v{self.CACHE_VERSION}.json")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        concepts = self._extract_concepts_uncached(srt_text, max_concepts)
+        try:
+            ensure_dir(self.cache_dir)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(concepts, f)
+        except OSError as e:
+            print(f"Could not write concept cache: {e}")
+        return concepts
+
+    def _extract_concepts_uncached(self, srt_text: str, max_concepts: int) -> List[str]:
         """Extract smart visual concepts from SRT text using NLP pipeline"""
         self._load_model()
 
         # Clean SRT text (remove timestamps and indices)
         clean_text = self._clean_srt_text(srt_text)
 
-        # Get all sentences
-        sentences = [s.strip() for s in clean_text.split('.') if s.strip()]
+        # Parse the whole transcript once and split it with the statistical
+        # sentence recognizer; both passes below work on these sentence Spans.
+        # The dependency parser is the costliest component; it and the
+        # lemmatizer aren't needed by the entity pass, so they only run if the
+        # noun-phrase pass does.
+        doc_path = self._doc_cache_path(clean_text)
+        doc = self._load_cached_doc(doc_path)
+        if doc is None:
+            doc = self.nlp.make_doc(clean_text)
+            for name, proc in self.nlp.pipeline:
+                if name not in _SECOND_PASS_PIPES:
+                    doc = proc(doc)
+            doc = self.nlp.get_pipe("senter")(doc)
+            self._save_cached_doc(doc_path, doc)
+        # Fragments and run-on "sentences" (unpunctuated auto-captions) rarely
+        # yield useful visual concepts; skip them in both passes
+        sentences = [sent for sent in doc.sents if 5 <= len(sent.text) <= 400]
 
         concepts = []
         seen_concepts = set()
 
         # First pass: extract named entities (highest priority)
-        for sentence in sentences:
-            if not sentence:
-                continue
-
-            doc = self.nlp(sentence)
-            for ent in doc.ents:
-                if ent.label_ in ['PERSON', 'ORG', 'GPE', 'LOC', 'EVENT', 'PRODUCT', 'WORK_OF_ART']:
-                    concept = ent.text.strip()
-                    if len(concept) > 2 and concept not in seen_concepts:
-                        concepts.append(concept)
-                        seen_concepts.add(concept)
-                        if len(concepts) >= max_concepts:
-                            break
-
-            if len(concepts) >= max_concepts:
-                break
+        for ent in _ents_within(doc.ents, sentences):
+            if ent.label_ in _CONCEPT_ENT_LABELS:
+                concept = ent.text.strip()
+                key = _norm_concept(concept)
+                if len(concept) > 2 and key not in seen_concepts:
+                    concepts.append(concept)
+                    seen_concepts.add(key)
+                    if len(concepts) >= max_concepts:
+                        break
 
         # Second pass: extract noun phrases and important nouns
         if len(concepts) < max_concepts:
-            for sentence in sentences:
-                if not sentence:
+            # noun_chunks need the parse; the parser keeps the sentence
+            # boundaries already set, so the Spans above stay valid.
+            # Scoring matches lemmas, which the lemmatizer derives from the tags.
+            missing_dep = not doc.has_annotation("DEP")
+            missing_lemma = not doc.has_annotation("LEMMA")
+            if missing_dep:
+                if not doc.tensor.size:
+                    # Loaded from the Doc cache: tensors aren't stored, recompute them
+                    self.nlp.get_pipe("tok2vec")(doc)
+                self.nlp.get_pipe("parser")(doc)
+            if missing_lemma:
+                self.nlp.get_pipe("lemmatizer")(doc)
+            if missing_dep or missing_lemma:
+                self._save_cached_doc(doc_path, doc)
+            for sent in sentences:
+                # Token counts: "Yeah, right." has no noun phrase worth a search,
+                # and long spans' noun chunks are mostly noise
+                if not 4 <= len(sent) <= 80:
                     continue
-
-                score = self._score_sentence_visual_importance(sentence)
+                score = self._score_sentence_visual_importance(sent)
                 if score < 0.2:  # Lower threshold for second pass
                     continue
 
-                sentence_concepts = self._extract_concepts_from_sentence(sentence)
+                sentence_concepts = self._extract_concepts_from_sentence(sent)
 
                 for concept in sentence_concepts:
-                    if (concept not in seen_concepts and
+                    key = _norm_concept(concept)
+                    if (key not in seen_concepts and
                         len(concept) > 3 and  # Longer concepts
                         len(concept.split()) <= 4):  # Not too many words
                         concepts.append(concept)
-                        seen_concepts.add(concept)
+                        seen_concepts.add(key)
 
                     if len(concepts) >= max_concepts:
                         break
@@ -136,87 +371,88 @@ class NLPConceptExtractor:
                 if len(concepts) >= max_concepts:
                     break
 
-        return concepts[:max_concepts]
+        return _drop_contained_concepts(concepts)[:max_concepts]
 
-    def _clean_srt_text(self, srt_text: str) -> str:
-        """Remove SRT formatting and timestamps"""
-        lines = srt_text.split('\n')
-        clean_lines = []
+    def _doc_cache_path(self, clean_text: str) -> Optional[str]:
+        """Where the parsed Doc for clean_text is cached (None without cache_dir)"""
+        if not self.cache_dir:
+            return None
+        key = hashlib.blake2b(clean_text.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, "docs", f"{key}.docbin")
 
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines, numbers, timestamps
-            if not line or line.isdigit() or '-->' in line:
-                continue
-            clean_lines.append(line)
-
-        return ' '.join(clean_lines)
-
-    def _score_sentence_visual_importance(self, sentence: str) -> float:
-        """Score sentence for visual concept potential"""
-        self._load_model()
-        doc = self.nlp(sentence.lower())
-
-        score = 0.0
+    def _load_cached_doc(self, path: Optional[str]):
+        if not path:
+            return None
+        from spacy.tokens import DocBin
 
-        # Count visual indicators
-        visual_words = {
-            'see', 'look', 'watch', 'view', 'appear', 'show', 'display',
-            'imagine', 'picture', 'visual', 'scene', 'image', 'photo',
-            'building', 'place', 'location', 'city', 'country', 'world'
-        }
+        try:
+            return next(DocBin().from_disk(path).get_docs(self.nlp.vocab))
+        except (OSError, ValueError, StopIteration):
+            return None
 
-        emotion_words = {
-            'amazing', 'beautiful', 'stunning', 'incredible', 'awesome',
-            'terrible', 'horrible', 'scary', 'exciting', 'dramatic'
-        }
+    def _save_cached_doc(self, path: Optional[str], doc) -> None:
+        if not path:
+            return
+        from spacy.tokens import DocBin
 
-        action_words = {
-            'fight', 'battle', 'war', 'revolution', 'change', 'transform',
-            'build', 'create', 'destroy', 'discover', 'invent', 'explore'
-        }
+        try:
+            ensure_dir(os.path.dirname(path))
+            DocBin(docs=[doc], store_user_data=False).to_disk(path)
+        except OSError as e:
+            print(f"Could not write Doc cache: {e}")
 
-        # Score based on content
-        words = set(token.lemma_.lower() for token in doc)
-        score += len(words.intersection(visual_words)) * 0.3
-        score += len(words.intersection(emotion_words)) * 0.2
-        score += len(words.intersection(action_words)) * 0.2
+    def _clean_srt_text(self, srt_text: str) -> str:
+        """Remove SRT formatting and timestamps"""
+        # Drop index and timestamp lines, then fold the rest onto one line
+        # (str.split() with no argument is the fastest whitespace collapse)
+        return ' '.join(_SRT_CUE_RE.sub('', srt_text).split())
+
+    def _score_sentence_visual_importance(self, doc) -> float:
+        """Score a parsed sentence (spaCy Doc or Span) for visual concept potential"""
+        # One sweep over the tokens; each distinct matching lemma counts once
+        matched = set()
+        for token in doc:
+            lemma = token.lemma_.lower()
+            if lemma in _CUE_WORD_WEIGHTS:
+                matched.add(lemma)
+        score = sum(_CUE_WORD_WEIGHTS[w] for w in matched)
 
         # Score based on named entities (high visual potential)
-        entities = [ent for ent in doc.ents if ent.label_ in ['PERSON', 'ORG', 'GPE', 'LOC', 'EVENT']]
-        score += len(entities) * 0.4
+        score += 0.4 * sum(1 for ent in doc.ents if ent.label_ in _SCORE_ENT_LABELS)
 
         # Score based on noun phrases (potential concepts)
-        noun_phrases = [chunk for chunk in doc.noun_chunks if len(chunk) > 1]
-        score += len(noun_phrases) * 0.1
+        score += 0.1 * sum(1 for chunk in doc.noun_chunks if len(chunk) > 1)
 
         return min(score, 1.0)  # Cap at 1.0
 
-    def _extract_concepts_from_sentence(self, sentence: str) -> List[str]:
-        """Extract potential image concepts from a sentence"""
-        self._load_model()
-        doc = self.nlp(sentence)
+    def _extract_concepts_from_sentence(self, doc) -> List[str]:
+        """Extract potential image concepts from a parsed sentence (spaCy Doc or Span)"""
 
         concepts = []
+        seen = set()  # mirrors concepts, for O(1) duplicate checks
 
         # Named entities (highest priority)
         for ent in doc.ents:
-            if ent.label_ in ['PERSON', 'ORG', 'GPE', 'LOC', 'EVENT']:
-                concepts.append(ent.text.strip())
+            if ent.label_ in _SCORE_ENT_LABELS:
+                concept = ent.text.strip()
+                concepts.append(concept)
+                seen.add(concept)
 
         # Noun phrases (medium priority)
         for chunk in doc.noun_chunks:
             concept = chunk.text.strip()
-            if len(concept.split()) > 1 and concept not in concepts:
+            if len(concept.split()) > 1 and concept not in seen:
                 concepts.append(concept)
+                seen.add(concept)
 
         # Important nouns (lower priority)
         for token in doc:
-            if (token.pos_ in ['NOUN', 'PROPN'] and
+            if (token.pos_ in ('NOUN', 'PROPN') and
                 not token.is_stop and
                 len(token.text) > 3 and
-                token.text not in concepts):
+                token.text not in seen):
                 concepts.append(token.text)
+                seen.add(token.text)
 
         return concepts
 
@@ -224,101 +460,206 @@ class NLPConceptExtractor:
 class JobProcessor:
     """Handles background job processing"""
 
+    # images/.concept_cache.json: safe_folder_name(concept) -> images saved so far
+    _CONCEPT_CACHE_NAME = ".concept_cache.json"
+
     def __init__(self, settings: Dict[str, Any], status_callback=None):
         self.settings = settings
         self.status_callback = status_callback
-        self.nlp_extractor = NLPConceptExtractor()
+        self.nlp_extractor = NLPConceptExtractor(cache_dir=os.path.join(APP_DIR, "cache", "concepts"))
+        # Shared by every job worker thread (see _browser_slot)
+        self._browser_lock = threading.Lock()
+        # (profile settings, exit stack, context) of the open image-search browser
+        self._browser: Optional[Tuple[Tuple[bool, str], AsyncExitStack, Any]] = None
 
     async def process_job(self, job: Job) -> None:
         """Process a single job through all stages"""
         try:
-            job.started_at = datetime.now()
-            job.status = JobStatus.DOWNLOADING
-            self._update_status(job)
-
-            # Create job directory (just topic name, no subtopics)
-            job_dir = os.path.join(job.output_dir, safe_folder_name(job.topic))
-            ensure_dir(job_dir)
-
-            # Save job metadata
-            self._save_job_metadata(job, job_dir)
+            data = await self._stage_download(job, None)
+            for stage in (self._stage_transcribe, self._stage_analyze, self._stage_images):
+                data = await stage(job, data)
+                if data is None:
+                    break
+            self._complete_job(job)
+        except Exception as e:
+            self._fail_job(job, e)
+        finally:
+            # The browser belongs to this call's event loop; don't leak it past it
+            await self._close_browser()
+
+    async def run_pipeline(self, jobs: "asyncio.Queue[Job]") -> None:
+        """Process jobs from an asyncio queue forever, overlapping stages across jobs.
+
+        Each stage has its own asyncio queue and workers, so one job can be
+        transcribing while the next downloads and an earlier one fetches images.
+        Whisper gets one worker per GPU (one on CPU), spaCy and the browser a
+        single worker each; downloads get max_parallel_jobs. jobs.task_done()
+        is called as each job finishes.
+        """
+        download_q, transcribe_q, analyze_q, images_q = (asyncio.Queue() for _ in range(4))
+
+        async def feed():
+            while True:
+                job = await jobs.get()
+                await download_q.put((job, None))
+
+        async def worker(inbox: asyncio.Queue, stage, outbox: Optional[asyncio.Queue]):
+            while True:
+                job, data = await inbox.get()
+                try:
+                    data = await stage(job, data)
+                except Exception as e:
+                    self._fail_job(job, e)
+                    jobs.task_done()
+                    continue
+                if data is None or outbox is None:
+                    self._complete_job(job)
+                    jobs.task_done()
+                else:
+                    await outbox.put((job, data))
+
+        n_downloads = max(1, int(self.settings.get("max_parallel_jobs", 2)))
+        n_transcribers = await asyncio.to_thread(whisper_parallelism)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(feed())
+                for _ in range(n_downloads):
+                    tg.create_task(worker(download_q, self._stage_download, transcribe_q))
+                for _ in range(n_transcribers):
+                    tg.create_task(worker(transcribe_q, self._stage_transcribe, analyze_q))
+                tg.create_task(worker(analyze_q, self._stage_analyze, images_q))
+                tg.create_task(worker(images_q, self._stage_images, None))
+        finally:
+            await self._close_browser()
+
+    # Stages: each takes (job, output of the previous stage) and returns the
+    # input for the next one, or None when the job has nothing left to do.
+
+    async def _stage_download(self, job: Job, _data) -> Tuple[str, str]:
+        job.started_at = datetime.now()
+        job.status = JobStatus.DOWNLOADING
+        self._update_status(job)
 
-            # Stage 1: Download video
-            await self._download_video(job, job_dir)
+        # Create job directory (just topic name, no subtopics)
+        job_dir = os.path.join(job.output_dir, safe_folder_name(job.topic))
+        await asyncio.to_thread(ensure_dir, job_dir)
 
-            # Stage 2: Generate SRT (if enabled)
-            srt_path = None
-            if self._should_generate_srt(job):
-                job.status = JobStatus.TRANSCRIBING
-                self._update_status(job)
-                srt_path = await self._generate_srt(job, job_dir)
+        # Save job metadata (file I/O stays off the event loop other jobs share)
+        await asyncio.to_thread(self._save_job_metadata, job, job_dir)
 
-            # Stage 3: Extract concepts and download images
-            if srt_path and os.path.exists(srt_path):
-                job.status = JobStatus.ANALYZING
-                self._update_status(job)
+        # Stage 1: Download video
+        video_file = await self._download_video(job, job_dir)
+        return job_dir, video_file
 
-                concepts = await self._extract_concepts(srt_path)
+    async def _stage_transcribe(self, job: Job, data: Tuple[str, str]) -> Optional[Tuple[str, str]]:
+        # Stage 2: Generate SRT (if enabled)
+        job_dir, video_file = data
+        if not self._should_generate_srt(job):
+            return None
+        job.status = JobStatus.TRANSCRIBING
+        self._update_status(job)
+        srt_path = await self._generate_srt(job, job_dir, video_file)
+        if not (srt_path and os.path.exists(srt_path)):
+            return None
+        return job_dir, srt_path
+
+    async def _stage_analyze(self, job: Job, data: Tuple[str, str]) -> Tuple[str, str, List[str]]:
+        # Stage 3: Extract concepts...
+        job_dir, srt_path = data
+        job.status = JobStatus.ANALYZING
+        self._update_status(job)
+        return job_dir, srt_path, await self._extract_concepts(srt_path)
 
-                job.status = JobStatus.IMAGES
-                self._update_status(job)
+    async def _stage_images(self, job: Job, data: Tuple[str, str, List[str]]) -> None:
+        # ...and download images
+        job_dir, srt_path, concepts = data
+        job.status = JobStatus.IMAGES
+        self._update_status(job)
+        await self._download_images(job, job_dir, concepts, srt_path)
+        return None
 
-                await self._download_images(job, job_dir, concepts)
+    def _complete_job(self, job: Job) -> None:
+        job.status = JobStatus.DONE
+        job.completed_at = datetime.now()
+        self._update_status(job)
 
-            job.status = JobStatus.DONE
-            job.completed_at = datetime.now()
-            self._update_status(job)
+    def _fail_job(self, job: Job, e: Exception) -> None:
+        job.status = JobStatus.ERROR
+        job.error = str(e)
+        job.completed_at = datetime.now()
+        self._update_status(job)
 
-        except Exception as e:
-            job.status = JobStatus.ERROR
-            job.error = str(e)
-            job.completed_at = datetime.now()
-            self._update_status(job)
+    async def _image_browser(self):
+        """The image-search browser context, kept open across jobs on the same event loop.
+
+        Reopened only when the profile settings change, so consecutive jobs skip the
+        Chromium launch. Call with _browser_slot held.
+        """
+        key = (bool(self.settings["use_existing_chrome_profile"]), self.settings["chrome_profile_dir"])
+        if self._browser is not None and self._browser[0] == key:
+            return self._browser[2]
+
+        await self._close_browser()
+        stack = AsyncExitStack()
+        context = await stack.enter_async_context(open_browser_context(False, *key))
+        self._browser = (key, stack, context)
+        return context
+
+    async def _close_browser(self) -> None:
+        if self._browser is not None:
+            _key, stack, _context = self._browser
+            self._browser = None
+            await stack.aclose()
+
+    @asynccontextmanager
+    async def _browser_slot(self):
+        """Hold the browser for one job at a time - a persistent profile can't be opened twice"""
+        await asyncio.to_thread(self._browser_lock.acquire)
+        try:
+            yield
+        finally:
+            self._browser_lock.release()
 
     def _update_status(self, job: Job):
         if self.status_callback:
             self.status_callback(job)
 
     def _save_job_metadata(self, job: Job, job_dir: str):
-        """Save job information to files"""
-        # links.txt
-        with open(os.path.join(job_dir, "links.txt"), "w") as f:
-            f.write(f"{job.url}\n")
-
-        # notes.txt
-        with open(os.path.join(job_dir, "notes.txt"), "w") as f:
-            f.write(job.notes + "\n" if job.notes else "")
-
-        # job.json
+        """Save job information to job.json (URL, notes and the rest in one file)"""
+        # Written to a temp file and swapped in, so it's never half-written
         job_data = {
             "id": job.id,
             "url": job.url,
             "platform": job.platform.value,
             "topic": job.topic,
+            "notes": job.notes,
             "created_at": job.created_at.isoformat(),
             "status": job.status.value
         }
-        with open(os.path.join(job_dir, "job.json"), "w") as f:
-            json.dump(job_data, f, indent=2)
+        job_path = os.path.join(job_dir, "job.json")
+        with open(job_path + ".tmp", "wb") as f:
+            f.write(orjson.dumps(job_data, option=orjson.OPT_INDENT_2))
+        os.replace(job_path + ".tmp", job_path)
 
     async def _download_video(self, job: Job, job_dir: str) -> str:
         """Download video using yt-dlp"""
-        import subprocess
-        import asyncio
-
         job.progress = "Downloading video..."
         self._update_status(job)
 
         try:
-            # Run yt-dlp as subprocess
+            # Run yt-dlp as subprocess; it prints the final file path once done.
+            # --progress keeps the progress lines that --print would silence,
+            # --newline puts each update on its own line so it can be streamed.
             cmd = [
                 "yt-dlp",
                 "--output", os.path.join(job_dir, "%(title)s.%(ext)s"),
                 "--merge-output-format", "mp4",
+                "--print", "after_move:filepath",
+                "--progress", "--newline",
                 job.url
             ]
 
-            # Run in subprocess and capture output
+            # Run in subprocess and stream its output line by line
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
@@ -326,16 +667,39 @@ class JobProcessor:
                 cwd=job_dir
             )
 
-            stdout, stderr = await process.communicate()
+            # Only the tail of each stream is kept, for the file path / error message
+            stdout_tail: deque = deque(maxlen=20)
+            stderr_tail: deque = deque(maxlen=20)
+            last_pct = None
+
+            async def pump(stream, tail: deque):
+                nonlocal last_pct
+                async for raw in stream:
+                    m = _YTDLP_PROGRESS_RE.search(raw)
+                    if not m:
+                        tail.append(raw.decode(errors="replace").rstrip())
+                        continue
+                    pct = int(float(m.group(1)))
+                    if pct != last_pct:  # one UI update per whole percent
+                        last_pct = pct
+                        job.progress = f"Downloading video... {pct}%"
+                        self._update_status(job)
+
+            await asyncio.gather(
+                pump(process.stdout, stdout_tail),
+                pump(process.stderr, stderr_tail),
+                process.wait(),
+            )
 
             if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown error"
+                error_msg = "\n".join(stderr_tail) or "Unknown error"
                 raise Exception(f"yt-dlp failed: {error_msg}")
 
-            # Find the downloaded video file
-            for file in os.listdir(job_dir):
-                if file.endswith(('.mp4', '.mkv', '.webm', '.mov')) and not file.endswith('.temp'):
-                    return os.path.join(job_dir, file)
+            # The downloaded video file is the last path yt-dlp printed
+            for line in reversed(stdout_tail):
+                path = line.strip()
+                if path and os.path.isfile(path):
+                    return path
 
             raise Exception("No video file found after download")
 
@@ -346,128 +710,133 @@ class JobProcessor:
 
     def _should_generate_srt(self, job: Job) -> bool:
         """Determine if SRT should be generated based on URL matching selected platform"""
-        platform_domains = {
-            Platform.TIKTOK: ['tiktok.com', 'vm.tiktok.com'],
-            Platform.YOUTUBE: ['youtube.com', 'youtu.be'],
-            Platform.INSTAGRAM: ['instagram.com'],
-            Platform.OTHER: []  # Accept any URL for other
-        }
-
-        domains = platform_domains.get(job.platform, [])
         # Generate SRT if URL matches the selected platform (or if OTHER is selected)
-        return job.platform == Platform.OTHER or any(domain in job.url for domain in domains)
+        return url_matches_platform(job.url, job.platform)
 
-    async def _generate_srt(self, job: Job, job_dir: str) -> str:
+    async def _generate_srt(self, job: Job, job_dir: str, video_file: str) -> str:
         """Generate SRT using Whisper"""
-        # Find video file
-        video_file = None
-        for file in os.listdir(job_dir):
-            if file.endswith(('.mp4', '.mkv', '.webm', '.mov')):
-                video_file = os.path.join(job_dir, file)
-                break
-
-        if not video_file:
-            raise Exception("No video file found for SRT generation")
-
         job.progress = "Generating SRT..."
         self._update_status(job)
 
-        srt_path, _ = generate_srt(video_file, self.settings["whisper_model"])
-        # Move SRT to job directory
-        final_srt = os.path.join(job_dir, "transcript.srt")
-        os.rename(srt_path, final_srt)
+        # Write straight into the job directory. Jobs on the same topic share
+        # job_dir and may transcribe concurrently, so name the SRT per job.
+        # Whisper is blocking; run it off the event loop.
+        srt_path, _ = await asyncio.to_thread(
+            generate_srt,
+            video_file,
+            self.settings["whisper_model"],
+            self.settings.get("whisper_compute_type", "auto"),
+            int(self.settings.get("whisper_workers", 1)),
+            srt_path=os.path.join(job_dir, f"transcript_{job.id}.srt"),
+        )
 
-        return final_srt
+        return srt_path
 
     async def _extract_concepts(self, srt_path: str) -> List[str]:
         """Extract visual concepts from SRT"""
-        with open(srt_path, 'r', encoding='utf-8') as f:
-            srt_text = f.read()
+        # mmap + one regex pass; the extractor gets transcript text with cues already stripped
+        srt_text = await asyncio.to_thread(srt_file_to_text, srt_path)
 
-        concepts = self.nlp_extractor.extract_concepts(srt_text, self.settings["max_concepts_per_srt"])
+        # spaCy is CPU-bound; keep the event loop free while it runs
+        concepts = await asyncio.to_thread(
+            self.nlp_extractor.extract_concepts, srt_text, self.settings["max_concepts_per_srt"]
+        )
         return concepts
 
-    async def _download_images(self, job: Job, job_dir: str, concepts: List[str]):
+    async def _download_images(self, job: Job, job_dir: str, concepts: List[str], srt_path: str):
         """Download images for concepts with smart search and Wikipedia fallback"""
         images_dir = os.path.join(job_dir, "images")
-        ensure_dir(images_dir)
+        await asyncio.to_thread(ensure_dir, images_dir)
 
-        # Extract timestamps from SRT for naming
-        timestamps = self._extract_srt_timestamps(job_dir)
-
-        total_images = 0
-        image_counter = 0
+        # Extract timestamps from SRT for naming (reads the SRT; off the loop)
+        timestamps = await asyncio.to_thread(self._extract_srt_timestamps, srt_path)
 
-        for i, concept in enumerate(concepts):
-            job.progress = f"Images: {concept} ({i+1}/{len(concepts)})"
-            self._update_status(job)
+        # Jobs on the same topic share images_dir; don't re-scrape concepts an
+        # earlier one already filled
+        concept_counts = await asyncio.to_thread(self._load_concept_counts, images_dir)
 
-            # Calculate images needed for this concept
-            images_per_concept = max(1, self.settings["images_per_concept"])
-            if total_images + images_per_concept > self.settings["max_total_images"]:
-                images_per_concept = max(1, self.settings["max_total_images"] - total_images)
-
-            if images_per_concept <= 0:
+        # Plan the image budget up front so concepts can be fetched concurrently.
+        # Each concept gets its own block of timestamp slots so names within this job
+        # never clash; names an earlier job already saved are skipped in broll_core.
+        plan: List[Tuple[str, int]] = []
+        start_counters: List[int] = []
+        counter_offsets: List[int] = []
+        image_counter = 0
+        for concept in concepts:
+            remaining = self.settings["max_total_images"] - image_counter
+            if remaining <= 0:
                 break
+            have = concept_counts.get(safe_folder_name(concept), 0)
+            wanted = max(1, self.settings["images_per_concept"]) - have
+            if wanted <= 0:
+                continue
+            images_per_concept = min(wanted, remaining)
+            plan.append((concept, images_per_concept))
+            start_counters.append(image_counter)
+            counter_offsets.append(have)  # number after the images already there
+            image_counter += images_per_concept
 
-            # Smart search: try normal search first
-            saved = await google_images_download(
-                keyword=concept,
-                out_dir=images_dir,
-                images_needed=images_per_concept,
-                max_scrolls=self.settings["max_scrolls_per_keyword"],
-                use_visible_browser=False,  # Always background
-                use_existing_profile=self.settings["use_existing_chrome_profile"],
-                chrome_profile_dir=self.settings["chrome_profile_dir"],
-                status_cb=None,
-                timestamp_based_naming=True,
-                timestamps=timestamps,
-                start_counter=image_counter
-            )
+        if not plan:
+            return
 
-            # If normal search didn't get enough, try Wikipedia search
-            wiki_needed = images_per_concept - saved
-            wiki_saved = 0
-
-            if wiki_needed > 0:
-                job.progress = f"Wikipedia: {concept} ({i+1}/{len(concepts)})"
-                self._update_status(job)
-
-                # Search with "Wikipedia" added for better quality images
-                wiki_keyword = f"{concept} Wikipedia"
-                wiki_saved = await google_images_download(
-                    keyword=wiki_keyword,
-                    out_dir=images_dir,
-                    images_needed=wiki_needed,
-                    max_scrolls=self.settings["max_scrolls_per_keyword"],
-                    use_visible_browser=False,  # Background
-                    use_existing_profile=self.settings["use_existing_chrome_profile"],
-                    chrome_profile_dir=self.settings["chrome_profile_dir"],
-                    status_cb=None,
-                    timestamp_based_naming=True,
-                    timestamps=timestamps,
-                    start_counter=image_counter + saved
+        use_existing_profile = self.settings["use_existing_chrome_profile"]
+        chrome_profile_dir = self.settings["chrome_profile_dir"]
+        browser_kwargs = dict(
+            out_dir=images_dir,
+            max_scrolls=self.settings["max_scrolls_per_keyword"],
+            use_visible_browser=False,  # Always background
+            use_existing_profile=use_existing_profile,
+            chrome_profile_dir=chrome_profile_dir,
+            status_cb=None,
+            timestamp_based_naming=True,
+            timestamps=timestamps,
+            max_concurrency=int(self.settings.get("max_parallel_keywords", 4)),
+        )
+
+        # Smart search: normal search per concept; a concept that comes up short
+        # is retried with "Wikipedia" added (better quality images) right away,
+        # while the other concepts are still searching
+        job.progress = f"Images: {len(plan)} concepts"
+        self._update_status(job)
+        async with self._browser_slot():
+            context = await self._image_browser()
+            try:
+                saved = await download_all(
+                    plan, start_counters=start_counters, counter_offsets=counter_offsets, context=context,
+                    fallback_suffix=" Wikipedia", **browser_kwargs,
                 )
+            except Exception:
+                # The browser may be what broke; let the next job start a fresh one
+                await self._close_browser()
+                raise
 
-            saved_total = saved + wiki_saved
-            total_images += saved_total
-            image_counter += saved_total
+        for (concept, _), got in zip(plan, saved):
+            key = safe_folder_name(concept)
+            concept_counts[key] = concept_counts.get(key, 0) + got
+        await asyncio.to_thread(self._save_concept_counts, images_dir, concept_counts)
 
-            if total_images >= self.settings["max_total_images"]:
-                break
+    def _load_concept_counts(self, images_dir: str) -> Dict[str, int]:
+        try:
+            with open(os.path.join(images_dir, self._CONCEPT_CACHE_NAME), "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
 
-    def _extract_srt_timestamps(self, job_dir: str) -> List[str]:
+    def _save_concept_counts(self, images_dir: str, counts: Dict[str, int]) -> None:
+        path = os.path.join(images_dir, self._CONCEPT_CACHE_NAME)
+        try:
+            with open(path + ".tmp", "wb") as f:
+                f.write(orjson.dumps(counts))
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"Could not write concept cache: {e}")
+
+    def _extract_srt_timestamps(self, srt_path: str) -> List[str]:
         """Extract timestamps from SRT file for image naming"""
         timestamps = []
-        srt_path = None
 
-        # Find SRT file
-        for file in os.listdir(job_dir):
-            if file.endswith('.srt'):
-                srt_path = os.path.join(job_dir, file)
-                break
-
-        if srt_path and os.path.exists(srt_path):
+        # The job's own SRT: same-topic jobs share job_dir, so never guess by scanning it
+        if srt_path and os.path.isfile(srt_path):
             try:
                 with open(srt_path, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -490,13 +859,20 @@ class JobProcessor:
 class UnifiedApp(tk.Tk):
     """Main application with job queue"""
 
+    # Serializes settings.json writes from the Tk thread and background saves
+    _settings_write_lock = threading.Lock()
+
     def __init__(self):
         super().__init__()
         self.title("Research & B-Roll Harvester")
         self.geometry("1200x800")
 
-        # Track settings window
+        # Track settings window; it is built once and withdrawn between opens
         self.settings_window = None
+        self._refresh_settings_window: Optional[Callable[[], None]] = None
+
+        # Home directory, resolved once (default output dir, profile auto-detect)
+        self._home = os.path.expanduser("~")
 
         # Set pink theme
         self.configure(bg='#FFE4E1')  # Misty Rose background
@@ -516,55 +892,76 @@ class UnifiedApp(tk.Tk):
 
         # Job management
         self.jobs: Dict[str, Job] = {}
-        self.job_queue = queue.Queue()
-        self.current_job: Optional[Job] = None
+        # Job ids in listbox order, so a selected row maps straight to its job
+        self._job_order: List[str] = []
         self.job_processor = JobProcessor(self.settings, self._on_job_status_update)
 
+        # Worker threads never touch Tk directly; they post callables here
+        # and the main loop drains them.
+        self._ui_queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        # Set by status updates; the job list is redrawn at most once per drain
+        self._job_list_dirty = False
+        # Status log lines from worker threads, written to the log in one insert per drain
+        self._pending_log: "deque[str]" = deque()
+
         # UI setup
         self._setup_ui()
+        self.after(100, self._drain_ui_queue)
 
-        # Start job processor thread
+        # Start the job pipeline thread - one event loop for the app's lifetime,
+        # stages overlap across jobs. Jobs are handed to it with _submit_job.
+        self._job_loop = asyncio.new_event_loop()
+        self._job_inbox: "asyncio.Queue[Job]" = asyncio.Queue()
         self.processing_thread = threading.Thread(target=self._process_jobs_loop, daemon=True)
         self.processing_thread.start()
 
+        # Load spaCy and Whisper now, so the first job doesn't stall on them mid-pipeline
+        threading.Thread(target=self._warm_models, daemon=True).start()
+
         # Enter key binding removed - only button click submits
 
     def _load_app_settings(self) -> Dict[str, Any]:
         """Load application settings"""
-        defaults = {
-            "whisper_model": "base",
-            "images_per_concept": 3,
-            "max_concepts_per_srt": 15,
-            "max_total_images": 50,
-            "max_scrolls_per_keyword": 6,
-            "use_visible_browser": True,
-            "use_existing_chrome_profile": False,
-            "chrome_profile_dir": "",
-            "srt_youtube_enabled": False,
-            "srt_other_enabled": False,
-        }
+        defaults = dict(APP_DEFAULT_SETTINGS)
 
         try:
             settings_file = os.path.join(os.path.dirname(__file__), "settings.json")
-            with open(settings_file, "r") as f:
-                loaded = json.load(f)
-                defaults.update(loaded)
+            defaults.update(read_settings_json(settings_file))
         except FileNotFoundError:
             pass
 
         return defaults
 
+    def _write_app_settings(self, settings: dict):
+        """Write settings.json (raises on failure)"""
+        settings_file = os.path.join(os.path.dirname(__file__), "settings.json")
+        with self._settings_write_lock:
+            write_settings_json(settings_file, settings)
+        print(f"Settings saved to {settings_file}")
+
     def _save_app_settings(self, settings: dict):
         """Save application settings"""
         try:
-            settings_file = os.path.join(os.path.dirname(__file__), "settings.json")
-            with open(settings_file, "w") as f:
-                json.dump(settings, f, indent=2)
-            print(f"Settings saved to {settings_file}")
+            self._write_app_settings(settings)
         except Exception as e:
             print(f"Error saving settings: {e}")
             messagebox.showerror("Save Error", f"Could not save settings: {e}")
 
+    def _save_app_settings_in_background(self, settings: dict):
+        """Save a snapshot of settings on a worker thread, so the Tk loop never waits on disk"""
+        snapshot = dict(settings)
+
+        def worker():
+            try:
+                self._write_app_settings(snapshot)
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+                err = str(e)
+                self._post_ui(lambda: messagebox.showerror("Save Error", f"Could not save settings: {err}"))
+
+        # Not a daemon: exiting right after Save must not cut the write off halfway
+        threading.Thread(target=worker).start()
+
     def _setup_ui(self):
         """Setup the main UI"""
         # Main container
@@ -600,7 +997,7 @@ class UnifiedApp(tk.Tk):
         dir_frame.pack(fill="x", pady=(0, 10))
 
         ttk.Label(dir_frame, text="Output Directory:").grid(row=0, column=0, sticky="w")
-        self.output_dir_var = tk.StringVar(value=os.path.expanduser("~/Downloads/broll_jobs"))
+        self.output_dir_var = tk.StringVar(value=os.path.join(self._home, "Downloads", "broll_jobs"))
         ttk.Entry(dir_frame, textvariable=self.output_dir_var, width=50).grid(row=0, column=1, padx=(10, 5))
         ttk.Button(dir_frame, text="Browse", command=self._choose_output_dir).grid(row=0, column=2)
 
@@ -688,15 +1085,6 @@ class UnifiedApp(tk.Tk):
             return
 
         # Download ALL videos, but only generate SRT/images from selected platform
-        platform_domains = {
-            Platform.TIKTOK: ['tiktok.com', 'vm.tiktok.com'],
-            Platform.YOUTUBE: ['youtube.com', 'youtu.be'],
-            Platform.INSTAGRAM: ['instagram.com'],
-            Platform.OTHER: []  # Accept any URL for other
-        }
-
-        domains = platform_domains.get(platform, [])
-
         # Create jobs for ALL URLs, but mark SRT generation based on platform match
         jobs_added = 0
         srt_jobs = 0
@@ -706,8 +1094,7 @@ class UnifiedApp(tk.Tk):
             job_topic = f"{topic} - {jobs_added + 1}" if len(all_urls) > 1 else topic
 
             # Check if this URL matches the selected platform for SRT generation
-            should_generate_srt = (platform == Platform.OTHER or
-                                 any(domain in url for domain in domains))
+            should_generate_srt = url_matches_platform(url, platform)
 
             if should_generate_srt:
                 srt_jobs += 1
@@ -725,7 +1112,8 @@ class UnifiedApp(tk.Tk):
 
             # Add to jobs dict and queue
             self.jobs[job.id] = job
-            self.job_queue.put(job)
+            self._job_order.append(job.id)
+            self._submit_job(job)
             jobs_added += 1
 
         # Update UI
@@ -746,11 +1134,11 @@ class UnifiedApp(tk.Tk):
     def _extract_topic_from_url(self, url: str) -> str:
         """Extract a basic topic from URL"""
         # Simple extraction - can be improved
-        if "tiktok.com" in url:
+        if url_matches_platform(url, Platform.TIKTOK):
             return "TikTok Video"
-        elif "youtube.com" in url or "youtu.be" in url:
+        elif url_matches_platform(url, Platform.YOUTUBE):
             return "YouTube Video"
-        elif "instagram.com" in url:
+        elif url_matches_platform(url, Platform.INSTAGRAM):
             return "Instagram Video"
         else:
             return f"Video {len(self.jobs) + 1}"
@@ -758,16 +1146,9 @@ class UnifiedApp(tk.Tk):
     def _update_job_list(self):
         """Update the job list display"""
         self.job_listbox.delete(0, "end")
-        for job in self.jobs.values():
-            status_emoji = {
-                JobStatus.QUEUED: "⏳",
-                JobStatus.DOWNLOADING: "⬇️",
-                JobStatus.TRANSCRIBING: "🎤",
-                JobStatus.ANALYZING: "🔍",
-                JobStatus.IMAGES: "🖼️",
-                JobStatus.DONE: "✅",
-                JobStatus.ERROR: "❌"
-            }.get(job.status, "❓")
+        for job_id in self._job_order:
+            job = self.jobs[job_id]
+            status_emoji = _STATUS_EMOJI.get(job.status, "❓")
 
             display_text = f"{status_emoji} {job.topic}"
             if job.progress:
@@ -780,8 +1161,7 @@ class UnifiedApp(tk.Tk):
         selection = self.job_listbox.curselection()
         if selection:
             index = selection[0]
-            job_id = list(self.jobs.keys())[index]
-            job = self.jobs[job_id]
+            job = self.jobs[self._job_order[index]]
 
             # Display job info in error box
             info = f"""📋 Job Details:
@@ -803,15 +1183,39 @@ Progress: {job.progress}
 
             self._show_error(info)
 
+    def _post_ui(self, fn: Callable[[], None]):
+        """Schedule fn on the Tk main thread (safe to call from any thread)"""
+        self._ui_queue.put(fn)
+
+    def _drain_ui_queue(self):
+        """Run pending UI callbacks from worker threads, then re-arm"""
+        for _ in range(100):
+            try:
+                fn = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn()
+            except Exception as e:
+                print(f"UI update failed: {e}")
+        if self._job_list_dirty:
+            self._job_list_dirty = False
+            self._update_job_list()
+        if self._pending_log:
+            self._append_log_lines([])
+        self.after(100, self._drain_ui_queue)
+
     def _on_job_status_update(self, job: Job):
-        """Handle job status updates"""
-        self.after(0, lambda: self._update_job_list())
-        self.after(0, lambda: self._log_status(f"Job {job.topic}: {job.status.value} - {job.progress}"))
+        """Handle job status updates (called from the worker thread)"""
+        status_msg = f"Job {job.topic}: {job.status.value} - {job.progress}"
+        # Any number of updates between drains costs a single redraw and log write
+        self._job_list_dirty = True
+        self._pending_log.append(self._format_log_line(status_msg))
 
         # Show errors in error box
         if job.error:
             error_msg = f"❌ Job Failed: {job.topic}\n{job.error}\n\nURL: {job.url}\nPlatform: {job.platform.value}"
-            self.after(0, lambda: self._show_error(error_msg))
+            self._post_ui(lambda: self._show_error(error_msg))
 
     def _show_error(self, message: str):
         """Show message in error box"""
@@ -820,33 +1224,64 @@ Progress: {job.progress}
         self.error_text.see("end")
 
     def _log_status(self, message: str):
-        """Log status message"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.status_text.insert("end", f"[{timestamp}] {message}\n")
+        """Log status message (after any worker lines still waiting for the drain)"""
+        self._append_log_lines([self._format_log_line(message)])
+
+    @staticmethod
+    def _format_log_line(message: str) -> str:
+        """Timestamp a status message (at the time it happened, not when it's shown)"""
+        return f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n"
+
+    def _append_log_lines(self, lines: List[str]):
+        """Append formatted lines to the status log with a single insert
+
+        Worker lines queued in _pending_log go first: they happened before these.
+        """
+        pending = []
+        while self._pending_log:
+            pending.append(self._pending_log.popleft())
+        self.status_text.insert("end", "".join(pending + lines))
         self.status_text.see("end")
 
     def _process_jobs_loop(self):
-        """Background job processing loop"""
+        """Background job processing thread: runs the persistent job event loop"""
+        asyncio.set_event_loop(self._job_loop)
+        self._job_loop.create_task(self._run_pipeline_forever())
+        self._job_loop.run_forever()
+
+    async def _run_pipeline_forever(self):
         while True:
             try:
-                # Get next job from queue
-                job = self.job_queue.get(timeout=1)
-                self.current_job = job
-
-                # Process job
-                asyncio.run(self.job_processor.process_job(job))
+                await self.job_processor.run_pipeline(self._job_inbox)
+            except Exception as e:
+                # Stage errors are recorded on the job; this is the pipeline itself failing
+                err_msg = f"Error processing job: {e}"
+                self._post_ui(lambda: self._log_status(err_msg))
+                await asyncio.sleep(1)
 
-                self.job_queue.task_done()
+    def _warm_models(self):
+        """Background warm-up of the NLP and Whisper models (best effort)"""
+        try:
+            self.job_processor.nlp_extractor._load_model()
+            model = self.settings.get("whisper_model", "base")
+            # Only warm a model that's already downloaded; no surprise downloads at startup
+            if whisper_model_available(model):
+                preload_whisper(model, self.settings.get("whisper_compute_type", "auto"))
+        except Exception as e:
+            err_msg = f"Model warm-up failed (will load on first use): {e}"
+            self._post_ui(lambda: self._log_status(err_msg))
 
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self._log_status(f"Error processing job: {e}")
-                continue
+    def _submit_job(self, job: Job):
+        """Queue a job on the pipeline's event loop (safe to call from the Tk thread)"""
+        self._job_loop.call_soon_threadsafe(self._job_inbox.put_nowait, job)
 
     def _show_settings(self):
         """Show settings dialog (only one at a time)"""
         if self.settings_window and self.settings_window.winfo_exists():
+            if self.settings_window.state() == "withdrawn":
+                # Reopened: show what is saved now, not what was last typed
+                self._refresh_settings_window()
+                self.settings_window.deiconify()
             self.settings_window.lift()
             self.settings_window.focus()
             return
@@ -858,15 +1293,15 @@ Progress: {job.progress}
         settings_window.configure(bg='#FFE4E1')
         self.settings_window = settings_window
 
-        # Handle window close
+        # Closing only hides the window; the next open re-shows it
         def on_close():
-            self.settings_window = None
-            settings_window.destroy()
+            settings_window.withdraw()
 
         settings_window.protocol("WM_DELETE_WINDOW", on_close)
 
         # Create settings variables
         whisper_var = tk.StringVar(value=self.settings.get("whisper_model", "base"))
+        compute_type_var = tk.StringVar(value=self.settings.get("whisper_compute_type", "auto"))
         images_per_concept_var = tk.IntVar(value=self.settings.get("images_per_concept", 3))
         max_concepts_var = tk.IntVar(value=self.settings.get("max_concepts_per_srt", 15))
         max_total_images_var = tk.IntVar(value=self.settings.get("max_total_images", 50))
@@ -875,6 +1310,18 @@ Progress: {job.progress}
         youtube_srt_var = tk.BooleanVar(value=self.settings.get("srt_youtube_enabled", False))
         other_srt_var = tk.BooleanVar(value=self.settings.get("srt_other_enabled", False))
 
+        def load_vars(values: Dict[str, Any]):
+            """Set every settings variable from values"""
+            whisper_var.set(values["whisper_model"])
+            compute_type_var.set(values["whisper_compute_type"])
+            images_per_concept_var.set(values["images_per_concept"])
+            max_concepts_var.set(values["max_concepts_per_srt"])
+            max_total_images_var.set(values["max_total_images"])
+            max_scrolls_var.set(values["max_scrolls_per_keyword"])
+            chrome_profile_var.set(values["chrome_profile_dir"])
+            youtube_srt_var.set(values["srt_youtube_enabled"])
+            other_srt_var.set(values["srt_other_enabled"])
+
         # Model status variable
         model_status_var = tk.StringVar(value="Checking...")
         self._check_whisper_model_status(model_status_var)
@@ -885,119 +1332,126 @@ Progress: {job.progress}
 
         row = 0
 
+        def add_row(label: str, widget: tk.Widget, sticky: str = "w"):
+            """Grid a label in column 0 and widget beside it, then move to the next row"""
+            nonlocal row
+            ttk.Label(main_frame, text=label).grid(row=row, column=0, sticky="w", pady=5)
+            widget.grid(row=row, column=1, sticky=sticky, pady=5)
+            row += 1
+
         # Whisper Model with management
-        ttk.Label(main_frame, text="Whisper Model:").grid(row=row, column=0, sticky="w", pady=5)
         model_frame = ttk.Frame(main_frame)
-        model_frame.grid(row=row, column=1, sticky="we", pady=5)
+        add_row("Whisper Model:", model_frame, sticky="we")
 
         whisper_combo = ttk.Combobox(model_frame, textvariable=whisper_var,
-                                   values=["tiny", "base", "small", "medium", "large"], state="readonly", width=10)
+                                   values=_WHISPER_MODELS, state="readonly", width=10)
         whisper_combo.pack(side="left")
 
         def load_model():
-            """Download/load the selected whisper model"""
+            """Download/load the selected whisper model (in the background)"""
             model = whisper_var.get()
-            try:
-                import whisper
-                self._show_error(f"Loading Whisper model '{model}'...")
-                settings_window.update()
-                whisper.load_model(model)  # This will download if needed
+            compute_type = compute_type_var.get()
+            self._show_error(f"Loading Whisper model '{model}'...")
+
+            def on_loaded():
                 self._show_error(f"✅ Whisper model '{model}' loaded successfully!")
                 messagebox.showinfo("Model Loaded", f"Whisper model '{model}' is ready to use!")
-            except Exception as e:
-                self._show_error(f"❌ Failed to load model '{model}': {str(e)}")
-                messagebox.showerror("Load Failed", f"Could not load model '{model}': {str(e)}")
+
+            def on_failed(err: str):
+                self._show_error(f"❌ Failed to load model '{model}': {err}")
+                messagebox.showerror("Load Failed", f"Could not load model '{model}': {err}")
+
+            def worker():
+                try:
+                    # Downloads the CTranslate2 weights if needed, then keeps the model cached
+                    preload_whisper(model, compute_type)
+                except Exception as e:
+                    err = str(e)
+                    self._post_ui(lambda: on_failed(err))
+                else:
+                    self._post_ui(on_loaded)
+
+            threading.Thread(target=worker, daemon=True).start()
 
         def auto_detect_models():
-            """Auto-detect available whisper models on system"""
-            import os
-            import whisper
-
-            # Check cache directory for downloaded models
-            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "whisper")
-            available_models = []
-
-            if os.path.exists(cache_dir):
-                for model in ["tiny", "base", "small", "medium", "large"]:
-                    model_files = [f for f in os.listdir(cache_dir) if model in f and f.endswith(('.pt', '.bin'))]
-                    if model_files:
-                        available_models.append(model)
-
-            if available_models:
-                # Use the largest available model
-                best_model = max(available_models, key=lambda x: ["tiny", "base", "small", "medium", "large"].index(x))
-                whisper_var.set(best_model)
-                self._show_error(f"✅ Auto-detected model: '{best_model}'")
-            else:
-                self._show_error("❌ No cached models found. Use 'Load' to download one.")
-                messagebox.showinfo("No Models", "No Whisper models found. Click 'Load' to download the selected model.")
+            """Auto-detect available whisper models on system (in the background)"""
+            def on_detected(best_model: Optional[str]):
+                if best_model:
+                    whisper_var.set(best_model)
+                    self._show_error(f"✅ Auto-detected model: '{best_model}'")
+                else:
+                    self._show_error("❌ No cached models found. Use 'Load' to download one.")
+                    messagebox.showinfo("No Models", "No Whisper models found. Click 'Load' to download the selected model.")
+
+            def worker():
+                # Check the local model cache, largest first; the first hit is the best model
+                best_model = next((m for m in reversed(_WHISPER_MODELS) if whisper_model_available(m)), None)
+                self._post_ui(lambda: on_detected(best_model))
+
+            threading.Thread(target=worker, daemon=True).start()
 
         ttk.Button(model_frame, text="Load", command=load_model).pack(side="left", padx=(5,0))
         ttk.Button(model_frame, text="Auto", command=auto_detect_models).pack(side="left", padx=(5,0))
 
         # Model status
         ttk.Label(model_frame, textvariable=model_status_var, font=("Arial", 8)).pack(side="left", padx=(10,0))
-        row += 1
 
-        # Images per concept
-        ttk.Label(main_frame, text="Images per Concept:").grid(row=row, column=0, sticky="w", pady=5)
-        ttk.Spinbox(main_frame, from_=1, to=10, textvariable=images_per_concept_var, width=15).grid(row=row, column=1, sticky="w", pady=5)
+        # Whisper precision (CTranslate2 compute type)
+        add_row("Whisper Precision:", ttk.Combobox(main_frame, textvariable=compute_type_var,
+                                                   values=WHISPER_COMPUTE_TYPES, state="readonly", width=15))
+        ttk.Label(main_frame, text="auto = int8 on CPU (fastest with AVX2/AVX-512 VNNI), int8_float16 on GPU",
+                  font=("Arial", 8)).grid(row=row, column=0, columnspan=2, sticky="w")
         row += 1
 
-        # Max concepts per SRT
-        ttk.Label(main_frame, text="Max Concepts per SRT:").grid(row=row, column=0, sticky="w", pady=5)
-        ttk.Spinbox(main_frame, from_=5, to=30, textvariable=max_concepts_var, width=15).grid(row=row, column=1, sticky="w", pady=5)
-        row += 1
+        # Numeric limits: (label, variable, min, max), one spinbox row each
+        spin_rows = (
+            ("Images per Concept:", images_per_concept_var, 1, 10),
+            ("Max Concepts per SRT:", max_concepts_var, 5, 30),
+            ("Max Total Images:", max_total_images_var, 10, 200),  # scaled from the two above
+            ("Max Scrolls per Keyword:", max_scrolls_var, 1, 20),
+        )
+        for label, var, lo, hi in spin_rows:
+            add_row(label, ttk.Spinbox(main_frame, from_=lo, to=hi, textvariable=var, width=15))
 
-        # Max total images (with proportional scaling)
-        ttk.Label(main_frame, text="Max Total Images:").grid(row=row, column=0, sticky="w", pady=5)
-        max_total_spinbox = ttk.Spinbox(main_frame, from_=10, to=200, textvariable=max_total_images_var, width=15)
-        max_total_spinbox.grid(row=row, column=1, sticky="w", pady=5)
+        scaling_after_id = None  # pending debounced update_scaling, if any
 
         def update_scaling():
             """Smart scaling when any value changes"""
+            nonlocal scaling_after_id
+            scaling_after_id = None
+            # IntVar.get() already returns an int; it only raises while a spinbox
+            # holds something that isn't a number yet (mid-edit)
             try:
-                images_per = int(images_per_concept_var.get())
-                max_concepts = int(max_concepts_var.get())
-                max_scrolls = int(max_scrolls_var.get())
-
-                # Calculate logical total: images_per * max_concepts * reasonable_multiplier
-                # We assume each concept might need 1-3 images, so scale max_total accordingly
-                calculated_total = images_per * max_concepts * 2  # *2 for some buffer
+                images_per = images_per_concept_var.get()
+                max_concepts = max_concepts_var.get()
+            except tk.TclError:
+                return
 
-                # Only update if it's significantly different (avoid infinite loops)
-                current_total = int(max_total_images_var.get())
-                if abs(calculated_total - current_total) > 5:
-                    max_total_images_var.set(max(10, min(200, calculated_total)))
+            # Calculate logical total: images_per * max_concepts * reasonable_multiplier
+            # We assume each concept might need 1-3 images, so scale max_total accordingly
+            calculated_total = images_per * max_concepts * 2  # *2 for some buffer
 
-            except (ValueError, TypeError):
-                pass
+            # The total isn't traced, so writing it can't loop back into here
+            max_total_images_var.set(max(10, min(200, calculated_total)))
 
         def on_any_change(*args):
-            """Update scaling when any spinbox changes"""
-            settings_window.after(300, update_scaling)  # Debounce
-
-        # Connect all spinboxes to scaling logic
+            """Update scaling when an input spinbox changes"""
+            # Debounce: a burst of edits reschedules one update instead of queueing many
+            nonlocal scaling_after_id
+            if scaling_after_id is not None:
+                settings_window.after_cancel(scaling_after_id)
+            scaling_after_id = settings_window.after(300, update_scaling)
+
+        # Only the two inputs of the calculation drive it; the total is its output
         images_per_concept_var.trace_add("write", on_any_change)
         max_concepts_var.trace_add("write", on_any_change)
-        max_scrolls_var.trace_add("write", on_any_change)
-        max_total_images_var.trace_add("write", on_any_change)
-        row += 1
-
-        # Max scrolls per keyword
-        ttk.Label(main_frame, text="Max Scrolls per Keyword:").grid(row=row, column=0, sticky="w", pady=5)
-        ttk.Spinbox(main_frame, from_=1, to=20, textvariable=max_scrolls_var, width=15).grid(row=row, column=1, sticky="w", pady=5)
-        row += 1
 
         # Browser visibility (note: always background for image search)
-        ttk.Label(main_frame, text="Browser Visibility:").grid(row=row, column=0, sticky="w", pady=5)
-        ttk.Label(main_frame, text="Background (recommended)", font=("Arial", 8)).grid(row=row, column=1, sticky="w", pady=5)
-        row += 1
+        add_row("Browser Visibility:", ttk.Label(main_frame, text="Background (recommended)", font=("Arial", 8)))
 
         # Chrome profile directory with auto-detection
-        ttk.Label(main_frame, text="Browser Profile:").grid(row=row, column=0, sticky="w", pady=5)
         profile_frame = ttk.Frame(main_frame)
-        profile_frame.grid(row=row, column=1, sticky="we", pady=5)
+        add_row("Browser Profile:", profile_frame, sticky="we")
 
         profile_entry = ttk.Entry(profile_frame, textvariable=chrome_profile_var, width=15)
         profile_entry.pack(side="left", fill="x", expand=True)
@@ -1007,47 +1461,25 @@ Progress: {job.progress}
             import os
             import platform
 
-            system = platform.system()
-            home = os.path.expanduser("~")
-
-            possible_paths = []
-
-            if system == "Linux":
-                possible_paths = [
-                    f"{home}/.config/google-chrome",
-                    f"{home}/.config/chromium",
-                    f"{home}/.mozilla/firefox",
-                ]
-            elif system == "Darwin":  # macOS
-                possible_paths = [
-                    f"{home}/Library/Application Support/Google/Chrome",
-                    f"{home}/Library/Application Support/Chromium",
-                    f"{home}/Library/Application Support/Firefox/Profiles",
-                ]
-            elif system == "Windows":
-                possible_paths = [
-                    f"{home}\\AppData\\Local\\Google\\Chrome\\User Data",
-                    f"{home}\\AppData\\Local\\Chromium\\User Data",
-                    f"{home}\\AppData\\Roaming\\Mozilla\\Firefox\\Profiles",
-                ]
-
-            # Check which paths exist
-            existing_paths = [path for path in possible_paths if os.path.exists(path)]
-
-            if existing_paths:
-                # Use the first available path
-                detected_path = existing_paths[0]
+            possible_paths = (
+                os.path.join(self._home, *suffix.split("/"))
+                for suffix in _PROFILE_SUFFIXES.get(platform.system(), ())
+            )
+
+            # Use the first path that exists; stop looking once one does
+            detected_path = next((path for path in possible_paths if os.path.isdir(path)), None)
+
+            if detected_path:
                 chrome_profile_var.set(detected_path)
                 # Save it to settings immediately
                 self.settings["chrome_profile_dir"] = detected_path
-                self._save_app_settings(self.settings)
+                self._save_app_settings_in_background(self.settings)
                 messagebox.showinfo("Auto-Detect", f"Found and saved profile: {detected_path}")
             else:
                 messagebox.showwarning("Auto-Detect", "No browser profiles found automatically")
 
         ttk.Button(profile_frame, text="Auto", command=auto_detect_profile).pack(side="left", padx=(2,0))
         ttk.Button(profile_frame, text="Browse", command=lambda: self._browse_chrome_profile(chrome_profile_var)).pack(side="right")
-        row += 1
 
         # SRT generation options
         ttk.Label(main_frame, text="SRT Generation:", font=("Arial", 10, "bold")).grid(row=row, column=0, columnspan=2, sticky="w", pady=(10,5))
@@ -1066,24 +1498,30 @@ Progress: {job.progress}
         def reset_settings():
             """Reset all settings to defaults"""
             # Reset variables to defaults
-            whisper_var.set("base")
-            images_per_concept_var.set(3)
-            max_concepts_var.set(15)
-            max_total_images_var.set(50)
-            max_scrolls_var.set(6)
-            chrome_profile_var.set("")
-            youtube_srt_var.set(False)
-            other_srt_var.set(False)
+            load_vars(APP_DEFAULT_SETTINGS)
 
             # Update model status
             self._check_whisper_model_status(model_status_var)
 
+        def refresh_settings():
+            """Reload the variables from the saved settings before re-showing"""
+            nonlocal scaling_after_id
+            load_vars({**APP_DEFAULT_SETTINGS, **self.settings})
+            # The saved total is what the user chose; don't let the traces rescale it
+            if scaling_after_id is not None:
+                settings_window.after_cancel(scaling_after_id)
+                scaling_after_id = None
+            self._check_whisper_model_status(model_status_var)
+
+        self._refresh_settings_window = refresh_settings
+
         def save_settings():
             old_model = self.settings.get("whisper_model", "base")
             new_model = whisper_var.get()
 
             new_settings = {
                 "whisper_model": new_model,
+                "whisper_compute_type": compute_type_var.get(),
                 "images_per_concept": images_per_concept_var.get(),
                 "max_concepts_per_srt": max_concepts_var.get(),
                 "max_total_images": max_total_images_var.get(),
@@ -1093,11 +1531,12 @@ Progress: {job.progress}
                 "srt_youtube_enabled": youtube_srt_var.get(),
                 "srt_other_enabled": other_srt_var.get(),
             }
-            self.settings.update(new_settings)
-            self._save_app_settings(new_settings)
+            # Saving without edits leaves settings.json as it is
+            if any(self.settings.get(k) != v for k, v in new_settings.items()):
+                self.settings.update(new_settings)
+                self._save_app_settings_in_background(self.settings)
 
-            self.settings_window = None
-            settings_window.destroy()
+            settings_window.withdraw()
 
             # Show message about model change
             if old_model != new_model:
@@ -1107,24 +1546,25 @@ Progress: {job.progress}
 
         ttk.Button(btn_frame, text="Save", command=save_settings).pack(side="left", padx=(0, 10))
         ttk.Button(btn_frame, text="Reset", command=reset_settings).pack(side="left", padx=(0, 10))
-        ttk.Button(btn_frame, text="Cancel", command=lambda: (setattr(self, 'settings_window', None), settings_window.destroy())).pack(side="left")
+        ttk.Button(btn_frame, text="Cancel", command=settings_window.withdraw).pack(side="left")
+
+        # Keyboard: Return saves, Escape cancels; the model picker starts focused
+        settings_window.bind("<Return>", lambda e: save_settings())
+        settings_window.bind("<Escape>", lambda e: settings_window.withdraw())
+        whisper_combo.focus_set()
 
     def _check_whisper_model_status(self, status_var):
-        """Check if the current whisper model is available"""
-        try:
-            import os
-            model = self.settings.get("whisper_model", "base")
-            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "whisper")
+        """Check if the current whisper model is available (in the background)"""
+        model = self.settings.get("whisper_model", "base")
+        status_var.set("Checking...")
 
-            if os.path.exists(cache_dir):
-                model_files = [f for f in os.listdir(cache_dir) if model in f and f.endswith(('.pt', '.bin'))]
-                if model_files:
-                    status_var.set("✅ Available")
-                    return
+        def worker():
+            # The first check imports faster_whisper/ctranslate2, which takes seconds;
+            # whisper_model_available stats the model cache itself and never raises
+            status = "✅ Available" if whisper_model_available(model) else "⚠️  Not downloaded"
+            self._post_ui(lambda: status_var.set(status))
 
-            status_var.set("⚠️  Not downloaded")
-        except:
-            status_var.set("❓ Unknown")
+        threading.Thread(target=worker, daemon=True).start()
 
     def _browse_chrome_profile(self, var):
         """Browse for Chrome profile directory"""
@@ -1142,19 +1582,22 @@ Progress: {job.progress}
 
         # Find the most recent job folder
         try:
-            subdirs = [d for d in os.listdir(base_output_dir)
-                      if os.path.isdir(os.path.join(base_output_dir, d))]
+            # DirEntry caches is_dir() (d_type) and stat(), so one stat per folder
+            with os.scandir(base_output_dir) as it:
+                subdirs = [(e.stat().st_mtime, e.path) for e in it if e.is_dir()]
             if subdirs:
-                # Sort by modification time (most recent first)
-                subdirs.sort(key=lambda x: os.path.getmtime(os.path.join(base_output_dir, x)), reverse=True)
-                most_recent_job = os.path.join(base_output_dir, subdirs[0])
-                os.system(f'xdg-open "{most_recent_job}"')
+                # Only the newest folder matters; a linear max() beats sorting them all
+                most_recent_job = max(subdirs)[1]
+                _open_in_file_manager(most_recent_job)
             else:
                 # No job folders, open base directory
-                os.system(f'xdg-open "{base_output_dir}"')
-        except Exception as e:
+                _open_in_file_manager(base_output_dir)
+        except Exception:
             # Fallback to base directory
-            os.system(f'xdg-open "{base_output_dir}"')
+            try:
+                _open_in_file_manager(base_output_dir)
+            except OSError as e:
+                messagebox.showerror("Error", f"Could not open {base_output_dir}: {e}")
 
 
 if __name__ == "__main__":